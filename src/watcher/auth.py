@@ -1,245 +1,628 @@
+import atexit
+import functools
 import os
+import random
+import socket
+import threading
 import time
-from typing import Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import TYPE_CHECKING, Any, Callable, Dict, Literal, Optional, Tuple
+
+import httpx
+import pendulum
 
 from watcher.http_client import ProductionHTTPClient
 
-# Cloud provider imports (optional dependencies)
-try:
+if TYPE_CHECKING:
+    from botocore.auth import SigV4Auth
+
+
+class AuthenticationError(Exception):
+    """Raised when authentication fails."""
+
+    pass
+
+
+# Cloud provider SDKs (optional dependencies) are imported on first use, so
+# bearer-token and unauthenticated clients never pay their import cost.
+
+
+@functools.cache
+def _load_google_auth() -> Tuple[Any, Any]:
+    """Import google-auth's service account module and transport Request."""
     from google.auth.transport.requests import Request
     from google.oauth2 import service_account
-except ImportError:
-    pass
 
-try:
+    return service_account, Request
+
+
+@functools.cache
+def _load_azure_identity() -> Any:
+    """Import azure-identity's DefaultAzureCredential."""
+    from azure.identity import DefaultAzureCredential
+
+    return DefaultAzureCredential
+
+
+@functools.cache
+def _load_botocore() -> Tuple[Any, Any, Any]:
+    """Import botocore's SigV4Auth, AWSRequest and Credentials."""
     from botocore.auth import SigV4Auth
     from botocore.awsrequest import AWSRequest
-except ImportError:
-    pass
+    from botocore.credentials import Credentials
 
-try:
-    from azure.identity import DefaultAzureCredential
-except ImportError:
-    pass
+    return SigV4Auth, AWSRequest, Credentials
 
 
-class AuthenticationError(Exception):
-    """Raised when authentication fails."""
+# Treat cached credentials as expired this many seconds early
+_EXPIRY_SKEW = 60
 
-    pass
+# Default cache lifetime (50 minutes) when the token response has no expiry
+_DEFAULT_TOKEN_LIFETIME = 3000
+
+
+class _TokenStore:
+    """Thread-safe LRU cache of credentials and their expiry times."""
+
+    def __init__(self, max_entries: int = 64):
+        self._entries: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.RLock()
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return the cached ``(value, expiry)`` for a key, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: Any, ttl: float) -> Tuple[Any, float]:
+        """Cache a value for ``ttl`` seconds and return the stored entry."""
+        entry = (value, time.monotonic() + ttl)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            # Evict the least recently used entries, e.g. rotated service accounts
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+
+# Credentials cache shared by every auth provider in the process
+_token_store = _TokenStore()
+
+# Refreshes currently in progress, keyed by cache key
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _fresh_entry(cache: _TokenStore, cache_key: str) -> Optional[Tuple[Any, float]]:
+    """Return the cached (value, expiry) if it is outside the expiry skew."""
+    entry = cache.get(cache_key)
+    if entry is not None and time.monotonic() + _EXPIRY_SKEW < entry[1]:
+        return entry
+    return None
+
+
+def _get_or_refresh(
+    cache: _TokenStore, cache_key: str, fetch: Callable[[], Tuple[Any, float]]
+) -> Any:
+    """
+    Return a cached value or refresh it, sharing one refresh between threads.
+
+    The first caller to miss the cache runs ``fetch`` and publishes the result
+    on a Future; concurrent callers for the same key wait on that Future
+    instead of hitting the metadata server themselves.
+    """
+    # Check cache
+    entry = _fresh_entry(cache, cache_key)
+    if entry is not None:
+        return entry[0]
+
+    with _inflight_lock:
+        # A refresh may have been published since the check above
+        entry = _fresh_entry(cache, cache_key)
+        if entry is not None:
+            return entry[0]
+        future = _inflight.get(cache_key)
+        owner = future is None
+        if owner:
+            future = Future()
+            _inflight[cache_key] = future
+
+    if not owner:
+        value, _ = future.result()
+        return value
+
+    try:
+        value, lifetime = fetch()
+        entry = cache.set(cache_key, value, lifetime)
+        future.set_result(entry)
+        return value
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(cache_key, None)
+
+
+def _token_lifetime(expires_in: Optional[Any]) -> float:
+    """Cache lifetime for a token, capped by the server-reported ``expires_in``."""
+    if expires_in is None:
+        return _DEFAULT_TOKEN_LIFETIME
+    try:
+        return min(_DEFAULT_TOKEN_LIFETIME, float(expires_in) - _EXPIRY_SKEW)
+    except (TypeError, ValueError):
+        return _DEFAULT_TOKEN_LIFETIME
+
+
+_SUPPORTED_CLOUDS = ("gcp", "azure", "aws")
+
+# Cloud environment detected by probing metadata servers, once per process
+_UNDETECTED = object()
+_detected_env: Any = _UNDETECTED
+_detected_env_lock = threading.Lock()
 
 
 def _detect_cloud_environment(http_client: ProductionHTTPClient) -> Optional[str]:
-    """Detect the current cloud environment."""
-    # Check for GCP
-    if os.getenv("GOOGLE_APPLICATION_CREDENTIALS") or os.path.exists(
-        "/var/run/secrets/kubernetes.io/serviceaccount/token"
-    ):
-        try:
-            response = http_client.get(
-                "http://metadata.google.internal/computeMetadata/v1/",
-                headers={"Metadata-Flavor": "Google"},
+    """
+    Detect the current cloud environment.
+
+    The ``WATCHER_FORCE_CLOUD`` environment variable (gcp, azure, aws or none)
+    skips detection entirely. Otherwise the metadata servers are probed on the
+    first call and the result is reused for the rest of the process.
+    """
+    global _detected_env
+
+    forced = os.getenv("WATCHER_FORCE_CLOUD")
+    if forced:
+        forced = forced.strip().lower()
+        if forced == "none":
+            return None
+        if forced not in _SUPPORTED_CLOUDS:
+            raise AuthenticationError(
+                f"Invalid WATCHER_FORCE_CLOUD value '{forced}'. "
+                f"Expected one of: {', '.join(_SUPPORTED_CLOUDS)}, none"
+            )
+        return forced
+
+    with _detected_env_lock:
+        if _detected_env is _UNDETECTED:
+            _detected_env = _probe_cloud_environment(http_client)
+        return _detected_env
+
+
+# Keep-alive client shared by all metadata-server and token requests
+_metadata_client: Optional[ProductionHTTPClient] = None
+_metadata_client_lock = threading.Lock()
+
+
+def _get_metadata_client() -> ProductionHTTPClient:
+    """Get the shared HTTP client for cloud metadata endpoints, creating it once."""
+    global _metadata_client
+    with _metadata_client_lock:
+        if _metadata_client is None:
+            _metadata_client = ProductionHTTPClient(
+                connect_timeout=2.0,
+                read_timeout=2.0,
+                write_timeout=2.0,
+                max_connections=4,
+                max_keepalive_connections=4,
+                # Token fetches retry themselves with shorter backoff
+                max_attempts=1,
             )
-            if response.status_code == 200:
-                return "gcp"
-        except:
-            pass
+            atexit.register(_metadata_client.close)
+        return _metadata_client
+
+
+_METADATA_IP = "169.254.169.254"
+_GCP_METADATA_HOST = "metadata.google.internal"
+
+# Metadata servers answer in well under 100 ms on real cloud hosts
+_PROBE_TIMEOUT = 0.5
+_PRECHECK_TIMEOUT = 0.05
+# Upper bound on detection; gethostbyname has no timeout of its own, so a slow
+# resolver would otherwise stall detection for the system resolver timeout
+_DETECTION_TIMEOUT = 1.0
+
+
+def _host_resolves(host: str) -> bool:
+    """Check whether a hostname resolves, without making a connection."""
+    try:
+        socket.gethostbyname(host)
+        return True
+    except OSError:
+        return False
+
+
+def _port_open(host: str, port: int = 80) -> bool:
+    """Check whether a TCP connection to host:port succeeds almost immediately."""
+    try:
+        with socket.create_connection((host, port), timeout=_PRECHECK_TIMEOUT):
+            return True
+    except OSError:
+        return False
+
+
+def _probe_gcp(http_client: ProductionHTTPClient) -> Optional[str]:
+    """Return "gcp" if the GCP metadata server answers."""
+    if not (
+        os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+        or os.path.exists("/var/run/secrets/kubernetes.io/serviceaccount/token")
+    ) or not _host_resolves(_GCP_METADATA_HOST):
+        return None
+    try:
+        response = http_client.get(
+            f"http://{_GCP_METADATA_HOST}/computeMetadata/v1/",
+            headers={"Metadata-Flavor": "Google"},
+            timeout=_PROBE_TIMEOUT,
+        )
+        if response.status_code == 200:
+            return "gcp"
+    except (httpx.HTTPError, OSError):
+        pass
+    return None
+
 
-    # Check for Azure
-    if os.getenv("AZURE_TENANT_ID") or os.getenv("AZURE_CLIENT_ID"):
+def _probe_azure(http_client: ProductionHTTPClient) -> Optional[str]:
+    """Return "azure" if the Azure instance metadata service answers."""
+    if not (
+        os.getenv("AZURE_TENANT_ID") or os.getenv("AZURE_CLIENT_ID")
+    ) or not _port_open(_METADATA_IP):
+        return None
+    try:
+        response = http_client.get(
+            f"http://{_METADATA_IP}/metadata/instance",
+            headers={"Metadata": "true"},
+            timeout=_PROBE_TIMEOUT,
+        )
+        if response.status_code == 200:
+            return "azure"
+    except (httpx.HTTPError, OSError):
+        pass
+    return None
+
+
+def _probe_aws(http_client: ProductionHTTPClient) -> Optional[str]:
+    """Return "aws" if the EC2 instance metadata service answers."""
+    if not (
+        os.getenv("AWS_ACCESS_KEY_ID") or os.getenv("AWS_REGION")
+    ) or not _port_open(_METADATA_IP):
+        return None
+    try:
+        response = http_client.get(
+            f"http://{_METADATA_IP}/latest/meta-data/", timeout=_PROBE_TIMEOUT
+        )
+        if response.status_code == 200:
+            return "aws"
+    except (httpx.HTTPError, OSError):
+        pass
+    return None
+
+
+def _probe_cloud_environment(http_client: ProductionHTTPClient) -> Optional[str]:
+    """
+    Probe cloud metadata servers to find the current environment.
+
+    The GCP, Azure and AWS probes run concurrently, so detection takes as
+    long as the slowest probe rather than the sum of all three. The first
+    probe to identify a cloud wins; probes still running after
+    _DETECTION_TIMEOUT are treated as not finding one.
+    """
+    pending = {
+        _start_probe(probe, http_client)
+        for probe in (_probe_gcp, _probe_azure, _probe_aws)
+    }
+    deadline = time.monotonic() + _DETECTION_TIMEOUT
+    while pending:
+        done, pending = wait(
+            pending,
+            timeout=max(deadline - time.monotonic(), 0),
+            return_when=FIRST_COMPLETED,
+        )
+        if not done:
+            return None
+        for future in done:
+            environment = future.result()
+            if environment is not None:
+                return environment
+    return None
+
+
+def _start_probe(
+    probe: Callable[[ProductionHTTPClient], Optional[str]],
+    http_client: ProductionHTTPClient,
+) -> Future:
+    """
+    Run a probe on a daemon thread and return a Future for its result.
+
+    Daemon threads let the interpreter exit while a probe that outlived the
+    detection deadline is still blocked on the network.
+    """
+    future = Future()
+
+    def run() -> None:
         try:
-            response = http_client.get(
-                "http://169.254.169.254/metadata/instance",
-                headers={"Metadata": "true"},
-            )
-            if response.status_code == 200:
-                return "azure"
-        except:
-            pass
+            future.set_result(probe(http_client))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="watcher-cloud-probe", daemon=True).start()
+    return future
+
 
-    # Check for AWS
-    if os.getenv("AWS_ACCESS_KEY_ID") or os.getenv("AWS_REGION"):
+# Metadata token requests are retried a few times with sub-second backoff
+_METADATA_ATTEMPTS = 3
+
+
+def _metadata_get(
+    http_client: ProductionHTTPClient, url: str, **kwargs
+) -> httpx.Response:
+    """
+    GET a metadata endpoint, retrying server and connection errors.
+
+    Uses short exponential backoff with jitter so a brief metadata outage
+    does not fail authentication. Client errors (4xx) are not retried.
+    """
+    for attempt in range(_METADATA_ATTEMPTS):
         try:
-            response = http_client.get("http://169.254.169.254/latest/meta-data/")
-            if response.status_code == 200:
-                return "aws"
-        except:
-            pass
+            response = http_client.get(url, **kwargs)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code < 500 or attempt == _METADATA_ATTEMPTS - 1:
+                raise
+        except (httpx.TransportError, OSError):
+            if attempt == _METADATA_ATTEMPTS - 1:
+                raise
+        time.sleep(min(0.5, random.uniform(0, 0.05 * 2**attempt)))
 
-    return None
+
+def _bearer_headers(token: str) -> Dict[str, str]:
+    """Build the Authorization header dict for a bearer token."""
+    return {"Authorization": f"Bearer {token}"}
 
 
-def _get_gcp_token(
-    cache: Dict,
+def _get_gcp_headers(
+    cache: _TokenStore,
     http_client: ProductionHTTPClient,
     service_account_path: Optional[str] = None,
-) -> str:
-    """Get GCP access token."""
+) -> Dict[str, str]:
+    """Get GCP auth headers, cached with the access token."""
     cache_key = f"gcp_{service_account_path or 'metadata'}"
 
-    # Check cache
-    if cache_key in cache:
-        token, expiry = cache[cache_key]
-        if time.time() < expiry:
-            return token
+    def fetch() -> Tuple[Dict[str, str], float]:
+        # Try metadata server first
+        if not service_account_path:
+            try:
+                response = _metadata_get(
+                    http_client,
+                    "http://metadata.google.internal/computeMetadata/v1/instance/service-accounts/default/token",
+                    headers={"Metadata-Flavor": "Google"},
+                )
+                token_data = response.json()
+                return _bearer_headers(token_data["access_token"]), _token_lifetime(
+                    token_data.get("expires_in")
+                )
+            except Exception as e:
+                raise AuthenticationError(
+                    f"Failed to get GCP access token from metadata server: {e}"
+                )
 
-    # Try metadata server first
-    if not service_account_path:
+        # Use service account file
         try:
-            response = http_client.get(
-                "http://metadata.google.internal/computeMetadata/v1/instance/service-accounts/default/token",
-                headers={"Metadata-Flavor": "Google"},
+            service_account, Request = _load_google_auth()
+        except ImportError:
+            raise AuthenticationError(
+                "google-auth library not installed. Install with: pip install etl-watcher-sdk[gcp]"
             )
-            response.raise_for_status()
-            token_data = response.json()
-            token = token_data["access_token"]
-            # Cache for 50 minutes
-            cache[cache_key] = (token, time.time() + 3000)
-            return token
+        try:
+            credentials = service_account.Credentials.from_service_account_file(
+                service_account_path
+            )
+            credentials.refresh(Request())
+            return _bearer_headers(credentials.token), _DEFAULT_TOKEN_LIFETIME
         except Exception as e:
             raise AuthenticationError(
-                f"Failed to get GCP access token from metadata server: {e}"
+                f"Failed to get GCP access token from service account: {e}"
             )
 
-    # Use service account file
-    try:
-        credentials = service_account.Credentials.from_service_account_file(
-            service_account_path
-        )
-        credentials.refresh(Request())
-        token = credentials.token
-        # Cache for 50 minutes
-        cache[cache_key] = (token, time.time() + 3000)
-        return token
-    except NameError:
-        raise AuthenticationError(
-            "google-auth library not installed. Install with: pip install etl-watcher-sdk[gcp]"
-        )
-    except Exception as e:
-        raise AuthenticationError(
-            f"Failed to get GCP access token from service account: {e}"
-        )
+    return _get_or_refresh(cache, cache_key, fetch)
 
 
-def _get_azure_token(
-    cache: Dict,
+def _get_azure_headers(
+    cache: _TokenStore,
     http_client: ProductionHTTPClient,
-) -> str:
-    """Get Azure access token."""
+) -> Dict[str, str]:
+    """Get Azure auth headers, cached with the access token."""
     cache_key = "azure_managed_identity"
 
-    # Check cache
-    if cache_key in cache:
-        token, expiry = cache[cache_key]
-        if time.time() < expiry:
-            return token
+    def fetch() -> Tuple[Dict[str, str], float]:
+        try:
+            DefaultAzureCredential = _load_azure_identity()
+        except ImportError:
+            # Fallback to manual metadata server call
+            try:
+                response = _metadata_get(
+                    http_client,
+                    "http://169.254.169.254/metadata/identity/oauth2/token",
+                    params={
+                        "api-version": "2018-02-01",
+                        "resource": "https://management.azure.com/",
+                    },
+                    headers={"Metadata": "true"},
+                )
+                token_data = response.json()
+                return _bearer_headers(token_data["access_token"]), _token_lifetime(
+                    token_data.get("expires_in")
+                )
+            except Exception as e:
+                raise AuthenticationError(f"Failed to get Azure access token: {e}")
 
-    try:
-        # Use Azure SDK if available
-        credential = DefaultAzureCredential()
-        token = credential.get_token("https://management.azure.com/.default").token
-        # Cache for 50 minutes
-        cache[cache_key] = (token, time.time() + 3000)
-        return token
-    except NameError:
-        # Fallback to manual metadata server call
         try:
-            response = http_client.get(
-                "http://169.254.169.254/metadata/identity/oauth2/token",
-                params={
-                    "api-version": "2018-02-01",
-                    "resource": "https://management.azure.com/",
-                },
-                headers={"Metadata": "true"},
-            )
-            response.raise_for_status()
-            token_data = response.json()
-            token = token_data["access_token"]
-            # Cache for 50 minutes
-            cache[cache_key] = (token, time.time() + 3000)
-            return token
+            # Use Azure SDK if available
+            credential = DefaultAzureCredential()
+            token = credential.get_token("https://management.azure.com/.default").token
+            return _bearer_headers(token), _DEFAULT_TOKEN_LIFETIME
         except Exception as e:
             raise AuthenticationError(f"Failed to get Azure access token: {e}")
-    except Exception as e:
-        raise AuthenticationError(f"Failed to get Azure access token: {e}")
+
+    return _get_or_refresh(cache, cache_key, fetch)
+
+
+_AWS_CREDENTIALS_KEY = "aws_credentials"
+
+# ECS/Fargate container credentials endpoint
+_AWS_CONTAINER_CREDENTIALS_HOST = "http://169.254.170.2"
+
+# Fail fast when the EC2 instance metadata service is not there
+_AWS_METADATA_TIMEOUT = httpx.Timeout(2.0, connect=0.5)
+
+
+def _aws_container_credentials_request() -> Tuple[Optional[str], Dict[str, str]]:
+    """Get the container credentials URL and headers, if running on ECS or EKS."""
+    relative_uri = os.getenv("AWS_CONTAINER_CREDENTIALS_RELATIVE_URI")
+    if relative_uri:
+        return f"{_AWS_CONTAINER_CREDENTIALS_HOST}{relative_uri}", {}
+
+    full_uri = os.getenv("AWS_CONTAINER_CREDENTIALS_FULL_URI")
+    if full_uri:
+        token = os.getenv("AWS_CONTAINER_AUTHORIZATION_TOKEN")
+        token_file = os.getenv("AWS_CONTAINER_AUTHORIZATION_TOKEN_FILE")
+        if token_file:
+            with open(token_file) as f:
+                token = f.read().strip()
+        return full_uri, {"Authorization": token} if token else {}
+
+    return None, {}
+
+
+def _parse_aws_credentials(
+    creds_data: Dict[str, Any],
+) -> Tuple[tuple[str, str, Optional[str]], float]:
+    """Parse a metadata credentials response into credentials and cache lifetime."""
+    creds = (
+        creds_data["AccessKeyId"],
+        creds_data["SecretAccessKey"],
+        creds_data.get("Token"),
+    )
+    expiration = creds_data.get("Expiration")
+    if expiration is None:
+        return creds, _DEFAULT_TOKEN_LIFETIME
+    expires_in = (pendulum.parse(expiration) - pendulum.now("UTC")).total_seconds()
+    return creds, _token_lifetime(expires_in)
+
+
+def _get_web_identity_credentials() -> tuple[str, str, Optional[str]]:
+    """Get EKS IRSA credentials through botocore's web identity provider."""
+    from botocore.session import get_session
+
+    credentials = get_session().get_credentials()
+    if credentials is None:
+        raise AuthenticationError("AWS web identity credentials not found")
+    frozen = credentials.get_frozen_credentials()
+    return frozen.access_key, frozen.secret_key, frozen.token
 
 
 def _get_aws_credentials(
-    cache: Dict,
+    cache: _TokenStore,
     http_client: ProductionHTTPClient,
 ) -> tuple[str, str, Optional[str]]:
     """Get AWS credentials."""
-    cache_key = "aws_credentials"
+    cache_key = _AWS_CREDENTIALS_KEY
 
-    # Check cache
-    if cache_key in cache:
-        creds, expiry = cache[cache_key]
-        if time.time() < expiry:
-            return creds
+    def fetch() -> Tuple[tuple[str, str, Optional[str]], float]:
+        try:
+            # ECS/Fargate and EKS Pod Identity serve credentials to the container
+            container_url, container_headers = _aws_container_credentials_request()
+            if container_url:
+                response = _metadata_get(
+                    http_client,
+                    container_url,
+                    headers=container_headers,
+                    timeout=_AWS_METADATA_TIMEOUT,
+                )
+                return _parse_aws_credentials(response.json())
 
-    # Try metadata server first
-    try:
-        metadata_url = (
-            "http://169.254.169.254/latest/meta-data/iam/security-credentials/"
-        )
-        response = http_client.get(metadata_url)
-        response.raise_for_status()
-        role_name = response.text.strip()
-
-        creds_url = f"http://169.254.169.254/latest/meta-data/iam/security-credentials/{role_name}"
-        response = http_client.get(creds_url)
-        response.raise_for_status()
-        creds_data = response.json()
-
-        creds = (
-            creds_data["AccessKeyId"],
-            creds_data["SecretAccessKey"],
-            creds_data.get("Token"),
-        )
-        # Cache for 50 minutes
-        cache[cache_key] = (creds, time.time() + 3000)
-        return creds
-    except Exception as e:
-        # Fall back to environment variables
-        access_key = os.getenv("AWS_ACCESS_KEY_ID")
-        secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-        session_token = os.getenv("AWS_SESSION_TOKEN")
+            # EKS IRSA has no metadata endpoint for the pod's role
+            if os.getenv("AWS_WEB_IDENTITY_TOKEN_FILE"):
+                return _get_web_identity_credentials(), _DEFAULT_TOKEN_LIFETIME
 
-        if not access_key or not secret_key:
-            raise AuthenticationError("AWS credentials not found")
+            # EC2 instance metadata
+            metadata_url = (
+                f"http://{_METADATA_IP}/latest/meta-data/iam/security-credentials/"
+            )
+            response = _metadata_get(
+                http_client, metadata_url, timeout=_AWS_METADATA_TIMEOUT
+            )
+            role_name = response.text.strip()
+
+            response = _metadata_get(
+                http_client, f"{metadata_url}{role_name}", timeout=_AWS_METADATA_TIMEOUT
+            )
+            return _parse_aws_credentials(response.json())
+        except (httpx.HTTPError, OSError):
+            # Fall back to environment variables
+            access_key = os.getenv("AWS_ACCESS_KEY_ID")
+            secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
+            session_token = os.getenv("AWS_SESSION_TOKEN")
+
+            if not access_key or not secret_key:
+                raise AuthenticationError("AWS credentials not found")
+
+            return (access_key, secret_key, session_token), _DEFAULT_TOKEN_LIFETIME
 
-        creds = (access_key, secret_key, session_token)
-        # Cache for 50 minutes
-        cache[cache_key] = (creds, time.time() + 3000)
-        return creds
+    return _get_or_refresh(cache, cache_key, fetch)
+
+
+def _get_aws_signer(
+    cache: _TokenStore,
+    http_client: ProductionHTTPClient,
+    region: str,
+) -> "SigV4Auth":
+    """Get a SigV4 signer for a region, rebuilt when the AWS credentials expire."""
+    cache_key = f"aws_signer_{region}"
+
+    def fetch() -> Tuple["SigV4Auth", float]:
+        SigV4Auth, _, Credentials = _load_botocore()
+        access_key, secret_key, session_token = _get_aws_credentials(cache, http_client)
+        signer = SigV4Auth(
+            credentials=Credentials(access_key, secret_key, session_token),
+            region_name=region,
+            service="execute-api",
+        )
+        # Expire together with the credentials the signer was built from
+        entry = cache.get(_AWS_CREDENTIALS_KEY)
+        if entry is None:
+            return signer, _DEFAULT_TOKEN_LIFETIME
+        return signer, entry[1] - time.monotonic()
+
+    return _get_or_refresh(cache, cache_key, fetch)
 
 
 def _sign_aws_request(
     method: str,
     url: str,
     headers: Dict[str, str],
-    cache: Dict,
+    cache: _TokenStore,
     http_client: ProductionHTTPClient,
     body: str = "",
     region: str = "us-east-1",
-) -> Dict[str, str]:
-    """Sign AWS request with credentials."""
+) -> None:
+    """Sign AWS request with credentials, adding the signature to headers in place."""
     try:
-        access_key, secret_key, session_token = _get_aws_credentials(cache, http_client)
+        _, AWSRequest, _ = _load_botocore()
+        signer = _get_aws_signer(cache, http_client, region)
 
         request = AWSRequest(method=method, url=url, data=body, headers=headers)
-        SigV4Auth(
-            credentials={
-                "access_key": access_key,
-                "secret_key": secret_key,
-                "token": session_token,
-            },
-            region_name=region,
-            service="execute-api",
-        ).add_auth(request)
+        signer.add_auth(request)
 
-        return dict(request.headers)
-    except NameError:
+        for key, value in request.headers.items():
+            headers[key] = value
+    except ImportError:
         raise AuthenticationError(
             "boto3 library not installed. Install with: pip install etl-watcher-sdk[aws]"
         )
@@ -247,51 +630,104 @@ def _sign_aws_request(
         raise AuthenticationError(f"Failed to sign AWS request: {e}")
 
 
+@functools.lru_cache(maxsize=128)
+def _classify_auth_string(auth: str) -> Literal["gcp", "bearer"]:
+    """Classify an auth string once per process as a GCP key file or bearer token."""
+    # Check if it's a file path (GCP service account)
+    if auth.endswith(".json") and os.path.exists(auth):
+        return "gcp"
+    # Assume it's a bearer token
+    return "bearer"
+
+
+class AuthProvider:
+    """Supplies auth headers for Watcher API requests."""
+
+    __slots__ = (
+        "auth_type",
+        "auth_value",
+        "_token_cache",
+        "_http_client",
+        "get_headers",
+        "signs_requests",
+    )
+
+    def __init__(
+        self,
+        auth_type: str,
+        auth_value: Optional[str] = None,
+        http_client: Optional[ProductionHTTPClient] = None,
+    ):
+        self.auth_type = auth_type
+        self.auth_value = auth_value
+        self._token_cache = _token_store
+        self._http_client = http_client
+        # Resolve the auth type once instead of on every request
+        self.get_headers = self._build_headers_fn(auth_type)
+        # AWS requires per-request SigV4 signing by the client
+        self.signs_requests = auth_type == "aws"
+
+    def _build_headers_fn(self, auth_type: str) -> Callable[[], Dict[str, str]]:
+        """
+        Pick the header builder for an auth type.
+
+        The returned dicts may be shared between calls and must not be mutated.
+        """
+        if auth_type == "bearer":
+            bearer_headers = _bearer_headers(self.auth_value)
+            return lambda: bearer_headers
+        builders = {
+            "gcp": self._gcp_headers,
+            "azure": self._azure_headers,
+        }
+        return builders.get(auth_type, self._no_headers)
+
+    def _no_headers(self) -> Dict[str, str]:
+        # A fresh dict, so AWS signing can add its headers to it in place
+        return {}
+
+    def _gcp_headers(self) -> Dict[str, str]:
+        return _get_gcp_headers(
+            cache=self._token_cache,
+            http_client=self._http_client,
+            service_account_path=self.auth_value,
+        )
+
+    def _azure_headers(self) -> Dict[str, str]:
+        return _get_azure_headers(
+            cache=self._token_cache, http_client=self._http_client
+        )
+
+    def get_cache(self) -> _TokenStore:
+        """Get the token cache used by this auth provider."""
+        return self._token_cache
+
+    def sign(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: str = "",
+        region: str = "us-east-1",
+    ) -> None:
+        """SigV4-sign a request with this provider's credentials, updating headers."""
+        _sign_aws_request(
+            method=method,
+            url=url,
+            headers=headers,
+            cache=self._token_cache,
+            http_client=self._http_client or _get_metadata_client(),
+            body=body,
+            region=region,
+        )
+
+
 def _create_auth_provider(
     auth: Optional[str] = None, http_client: Optional[ProductionHTTPClient] = None
-):
-    """Create authentication provider - returns a simple object with get_headers method."""
+) -> AuthProvider:
+    """Create the authentication provider for an auth setting."""
     if http_client is None:
-        http_client = ProductionHTTPClient()
-
-    class AuthProvider:
-        def __init__(
-            self,
-            auth_type: str,
-            auth_value: Optional[str] = None,
-            http_client: ProductionHTTPClient = None,
-        ):
-            self.auth_type = auth_type
-            self.auth_value = auth_value
-            self._token_cache = {}
-            self._http_client = http_client
-
-        def get_headers(self) -> Dict[str, str]:
-            if self.auth_type == "none":
-                return {}
-            elif self.auth_type == "bearer":
-                return {"Authorization": f"Bearer {self.auth_value}"}
-            elif self.auth_type == "gcp":
-                token = _get_gcp_token(
-                    cache=self._token_cache,
-                    http_client=self._http_client,
-                    service_account_path=self.auth_value,
-                )
-                return {"Authorization": f"Bearer {token}"}
-            elif self.auth_type == "azure":
-                token = _get_azure_token(
-                    cache=self._token_cache, http_client=self._http_client
-                )
-                return {"Authorization": f"Bearer {token}"}
-            elif self.auth_type == "aws":
-                # AWS requires per-request signing, return signal to client
-                return {
-                    "X-AWS-Auth": "true"
-                }  # Signal to client that AWS signing is needed
-
-        def get_cache(self) -> Dict:
-            """Get the token cache for this auth provider instance."""
-            return self._token_cache
+        http_client = _get_metadata_client()
 
     if auth is None:
         # Auto-detect
@@ -306,9 +742,4 @@ def _create_auth_provider(
             return AuthProvider("none", http_client=http_client)
 
     elif isinstance(auth, str):
-        # Check if it's a file path (GCP service account)
-        if auth.endswith(".json") and os.path.exists(auth):
-            return AuthProvider("gcp", auth, http_client=http_client)
-        else:
-            # Assume it's a bearer token
-            return AuthProvider("bearer", auth, http_client=http_client)
+        return AuthProvider(_classify_auth_string(auth), auth, http_client=http_client)
@@ -6,7 +6,7 @@ import httpx
 import pendulum
 from pydantic_extra_types.pendulum_dt import Date, DateTime
 
-from watcher.auth import AuthenticationError, _create_auth_provider, _sign_aws_request
+from watcher.auth import AuthenticationError, _create_auth_provider
 from watcher.exceptions import WatcherNetworkError, handle_http_error
 from watcher.http_client import ProductionHTTPClient
 from watcher.models.address_lineage import _AddressLineagePostInput
@@ -39,7 +39,7 @@ class Watcher:
         """
         self.base_url = base_url
         self.client = ProductionHTTPClient(base_url=base_url)
-        self.auth_provider = _create_auth_provider(auth, http_client=self.client)
+        self.auth_provider = _create_auth_provider(auth)
 
     def _make_request(self, method: str, endpoint: str, **kwargs):
         """Make an HTTP request with proper error handling."""
@@ -47,22 +47,16 @@ class Watcher:
         auth_headers = self.auth_provider.get_headers()
 
         # Handle AWS signing if needed
-        if "X-AWS-Auth" in auth_headers:
-            # Remove the AWS auth signal header
-            auth_headers.pop("X-AWS-Auth")
-
+        if self.auth_provider.signs_requests:
             # Sign the request with AWS credentials
             try:
-                signed_headers = _sign_aws_request(
+                self.auth_provider.sign(
                     method=method,
                     url=f"{self.base_url}{endpoint}",
                     headers=auth_headers,
-                    cache=self.auth_provider.get_cache(),
-                    http_client=self.client,
                     body=kwargs.get("data", ""),
                     region="us-east-1",
                 )
-                auth_headers.update(signed_headers)
             except Exception as e:
                 raise AuthenticationError(f"Failed to sign AWS request: {e}")
 
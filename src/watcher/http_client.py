@@ -93,7 +93,7 @@ class ProductionHTTPClient:
         )
 
         self.client = httpx.Client(
-            base_url=base_url,
+            base_url=base_url or "",
             timeout=httpx_timeout,
             headers=default_headers,
             limits=httpx.Limits(
@@ -1,18 +1,122 @@
+import socket
+from unittest.mock import Mock
+
+import httpx
 import pytest
 
 from watcher import Watcher
+from watcher.auth import AuthProvider
+from watcher.http_client import ProductionHTTPClient
 from watcher.models.address_lineage import Address, AddressLineage
 from watcher.models.pipeline import Pipeline, PipelineConfig
+from watcher.tests.helpers import fake_response, make_side_effect
 from watcher.types import DatePartEnum
 
 
-@pytest.fixture
+def _unpatched_handler(request):
+    raise AssertionError(
+        f"Unpatched API request: {request.method} {request.url}; "
+        "use patched_request or block_network"
+    )
+
+
+@pytest.fixture(scope="session")
 def watcher_client():
-    """Create a Watcher client for testing."""
-    return Watcher("https://api.watcher.example.com")
+    """
+    Create a Watcher client shared by the whole session.
+
+    Tests patch the HTTP layer per test, so the client holds no test state.
+    Its transport fails any request that reaches it, so an unpatched call
+    neither leaves the process nor passes silently. __init__ is bypassed so
+    no connection pool is built and no cloud auth is detected;
+    test_watcher_initialization covers the real constructor.
+    """
+    http_client = ProductionHTTPClient.__new__(ProductionHTTPClient)
+    http_client.base_url = "https://api.watcher.example.com"
+    http_client.max_attempts = 5
+    http_client.client = httpx.Client(
+        base_url=http_client.base_url,
+        transport=httpx.MockTransport(_unpatched_handler),
+    )
+
+    client = Watcher.__new__(Watcher)
+    client.base_url = http_client.base_url
+    client.client = http_client
+    client.auth_provider = AuthProvider("none")
+    yield client
+    http_client.close()
+
+
+def _blocked_connect(*args, **kwargs):
+    raise ConnectionRefusedError("Network access is disabled during tests")
+
+
+def _blocked_lookup(*args, **kwargs):
+    raise socket.gaierror("DNS lookups are disabled during tests")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_network():
+    """
+    Fail fast on any real connection or DNS lookup for the whole session.
+
+    The errors are OSErrors, so code that handles an unreachable network
+    behaves as it would offline.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(socket.socket, "connect", _blocked_connect)
+        mp.setattr(socket, "getaddrinfo", _blocked_lookup)
+        mp.setattr(socket, "gethostbyname", _blocked_lookup)
+        yield
+
+
+def _offline_request(self, *args, **kwargs):
+    return fake_response({"id": 0})
+
+
+@pytest.fixture
+def block_network(monkeypatch):
+    """
+    Answer every API request with a generic success.
+
+    For tests that only need the HTTP layer stubbed out; tests asserting on
+    calls or responses use patched_request instead.
+    """
+    monkeypatch.setattr(ProductionHTTPClient, "request_with_retry", _offline_request)
 
 
 @pytest.fixture
+def mock_request_with_retry(monkeypatch):
+    """Replace ProductionHTTPClient.request_with_retry with a Mock."""
+    mock = Mock()
+    monkeypatch.setattr(ProductionHTTPClient, "request_with_retry", mock)
+    return mock
+
+
+@pytest.fixture
+def patched_request(monkeypatch):
+    """
+    Serve canned responses from ProductionHTTPClient.request_with_retry.
+
+    Returns a setup function taking the responses in call order; it returns
+    the list of (args, kwargs) the stub was called with.
+    """
+
+    def _setup(responses):
+        calls = []
+        next_response = make_side_effect(*responses)
+
+        def stub(self, *args, **kwargs):
+            calls.append((args, kwargs))
+            return next_response()
+
+        monkeypatch.setattr(ProductionHTTPClient, "request_with_retry", stub)
+        return calls
+
+    return _setup
+
+
+@pytest.fixture(scope="session")
 def sample_pipeline():
     """Create a sample Pipeline for testing."""
     return Pipeline(
@@ -28,7 +132,7 @@ def sample_pipeline():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_source_address():
     """Create a sample Address for testing."""
     return Address(
@@ -38,7 +142,7 @@ def sample_source_address():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_target_address():
     """Create a sample Address for testing."""
     return Address(
@@ -48,7 +152,7 @@ def sample_target_address():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_address_lineage(sample_source_address, sample_target_address):
     """Create a sample AddressLineage for testing."""
     return AddressLineage(
@@ -57,7 +161,7 @@ def sample_address_lineage(sample_source_address, sample_target_address):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pipeline_config(sample_pipeline, sample_address_lineage):
     """Create a sample PipelineConfig for testing."""
     return PipelineConfig(
@@ -65,7 +169,7 @@ def sample_pipeline_config(sample_pipeline, sample_address_lineage):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_responses():
     """Create mock API responses for testing."""
     return {
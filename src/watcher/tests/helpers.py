@@ -0,0 +1,55 @@
+"""
+Plain test helpers shared across test modules; fixtures live in conftest.py.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Optional
+
+
+def fake_response(json=None, status=200, text="", headers=None):
+    """Build a lightweight stand-in for an httpx.Response."""
+    return SimpleNamespace(
+        json=lambda: json,
+        raise_for_status=lambda: None,
+        status_code=status,
+        text=text,
+        headers=headers or {},
+    )
+
+
+@dataclass(slots=True)
+class FakeDagsterContext:
+    """Stand-in for a Dagster execution context."""
+
+    run_id: str
+    partition_key: str
+    dag_id: Optional[str] = None
+    task_id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class FakeAirflowContext:
+    """Stand-in for an Airflow task context object; has no run_id."""
+
+    execution_date: datetime
+    dag_id: str
+    task_id: str
+
+
+def make_side_effect(*responses):
+    """
+    Build a callable returning responses in order, for use as a side_effect.
+
+    Exception instances are raised instead of returned, as with a Mock list.
+    """
+    remaining = iter(responses)
+
+    def side_effect(*args, **kwargs):
+        response = next(remaining)
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    return side_effect
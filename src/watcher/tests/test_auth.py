@@ -0,0 +1,406 @@
+"""
+Tests for the authentication helpers.
+"""
+
+import threading
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from watcher import auth
+from watcher.auth import (
+    _EXPIRY_SKEW,
+    AuthenticationError,
+    _detect_cloud_environment,
+    _get_gcp_headers,
+    _TokenStore,
+)
+from watcher.http_client import ProductionHTTPClient
+from watcher.tests.helpers import fake_response, make_side_effect
+
+
+def _token_response(token="test-token", expires_in=None):
+    return fake_response({"access_token": token, "expires_in": expires_in})
+
+
+def test_gcp_token_is_cached():
+    """Test a cached GCP token is returned without another metadata call."""
+    http_client = Mock(spec=ProductionHTTPClient)
+    http_client.get.return_value = _token_response()
+    cache = _TokenStore()
+
+    assert _get_gcp_headers(cache, http_client) == {
+        "Authorization": "Bearer test-token"
+    }
+    assert _get_gcp_headers(cache, http_client) == {
+        "Authorization": "Bearer test-token"
+    }
+    assert http_client.get.call_count == 1
+
+
+def test_concurrent_token_refresh_is_deduplicated():
+    """Test concurrent cache misses share a single metadata request."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_get(*args, **kwargs):
+        started.set()
+        release.wait(timeout=5)
+        return _token_response()
+
+    http_client = Mock(spec=ProductionHTTPClient)
+    http_client.get.side_effect = slow_get
+    cache = _TokenStore()
+    results = []
+
+    def worker():
+        results.append(_get_gcp_headers(cache, http_client))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    threads[0].start()
+    started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == [{"Authorization": "Bearer test-token"}] * 5
+    assert all(headers is results[0] for headers in results)
+    assert http_client.get.call_count == 1
+
+
+def test_refresh_published_after_cache_miss_is_reused():
+    """Test a caller that misses the cache rechecks it before fetching again."""
+
+    class LateStore(_TokenStore):
+        # The first read misses, as if another thread's refresh landed just after
+        misses = 1
+
+        def get(self, key):
+            if self.misses:
+                self.misses -= 1
+                return None
+            return super().get(key)
+
+    cache = LateStore()
+    cache.set("token", "fresh", 3600)
+    fetch = Mock()
+
+    assert auth._get_or_refresh(cache, "token", fetch) == "fresh"
+    fetch.assert_not_called()
+
+
+def test_failed_refresh_is_not_cached():
+    """Test a failed refresh raises and the next call retries."""
+    http_client = Mock(spec=ProductionHTTPClient)
+    http_client.get.side_effect = make_side_effect(
+        Exception("metadata down"), _token_response()
+    )
+    cache = _TokenStore()
+
+    with pytest.raises(AuthenticationError):
+        _get_gcp_headers(cache, http_client)
+
+    assert _get_gcp_headers(cache, http_client) == {
+        "Authorization": "Bearer test-token"
+    }
+    assert http_client.get.call_count == 2
+
+
+def test_token_refreshed_before_expiry():
+    """Test a token inside the expiry skew window is treated as expired."""
+    http_client = Mock(spec=ProductionHTTPClient)
+    http_client.get.side_effect = make_side_effect(
+        _token_response("first", expires_in=2 * _EXPIRY_SKEW),
+        _token_response("second"),
+    )
+    cache = _TokenStore()
+
+    assert _get_gcp_headers(cache, http_client) == {"Authorization": "Bearer first"}
+    # Lifetime is expires_in minus the skew, so the next read is already stale
+    assert _get_gcp_headers(cache, http_client) == {"Authorization": "Bearer second"}
+
+
+def test_cloud_environment_detected_once(monkeypatch):
+    """Test metadata servers are only probed on the first detection."""
+    monkeypatch.delenv("WATCHER_FORCE_CLOUD", raising=False)
+    monkeypatch.setattr(auth, "_detected_env", auth._UNDETECTED)
+    probe = Mock(return_value="gcp")
+    monkeypatch.setattr(auth, "_probe_cloud_environment", probe)
+
+    assert _detect_cloud_environment(Mock()) == "gcp"
+    assert _detect_cloud_environment(Mock()) == "gcp"
+    assert probe.call_count == 1
+
+
+@pytest.mark.parametrize("value,expected", [("AWS", "aws"), ("none", None)])
+def test_force_cloud_skips_probes(monkeypatch, value, expected):
+    """Test WATCHER_FORCE_CLOUD overrides detection without probing."""
+    monkeypatch.setenv("WATCHER_FORCE_CLOUD", value)
+    probe = Mock()
+    monkeypatch.setattr(auth, "_probe_cloud_environment", probe)
+
+    assert _detect_cloud_environment(Mock()) == expected
+    probe.assert_not_called()
+
+
+def test_force_cloud_rejects_unknown_value(monkeypatch):
+    """Test an unsupported WATCHER_FORCE_CLOUD value raises."""
+    monkeypatch.setenv("WATCHER_FORCE_CLOUD", "oracle")
+
+    with pytest.raises(AuthenticationError, match="WATCHER_FORCE_CLOUD"):
+        _detect_cloud_environment(Mock())
+
+
+def test_probe_skips_unreachable_metadata_server(monkeypatch):
+    """Test no HTTP probe is made when the metadata server is unreachable."""
+    monkeypatch.setenv("AWS_REGION", "us-east-1")
+    monkeypatch.setattr(auth, "_port_open", lambda host, port=80: False)
+    http_client = Mock(spec=ProductionHTTPClient)
+
+    assert auth._probe_cloud_environment(http_client) is None
+    http_client.get.assert_not_called()
+
+
+def test_bearer_headers_built_once():
+    """Test the bearer auth header is prebuilt at provider construction."""
+    provider = auth._create_auth_provider("my-token", http_client=Mock())
+
+    headers = provider.get_headers()
+    assert headers == {"Authorization": "Bearer my-token"}
+    assert provider.get_headers() is headers
+
+
+def test_only_aws_provider_signs_requests():
+    """Test signing is decided at construction and AWS gets a fresh headers dict."""
+    provider = auth.AuthProvider("aws", http_client=Mock())
+
+    assert provider.signs_requests
+    assert provider.get_headers() == {}
+    assert provider.get_headers() is not provider.get_headers()
+    assert not auth._create_auth_provider("my-token", http_client=Mock()).signs_requests
+
+
+def test_probe_treats_connection_errors_as_not_cloud(monkeypatch):
+    """Test metadata connection errors are swallowed but interrupts are not."""
+    monkeypatch.setenv("AWS_REGION", "us-east-1")
+    monkeypatch.setattr(auth, "_port_open", lambda host, port=80: True)
+    http_client = Mock(spec=ProductionHTTPClient)
+
+    http_client.get.side_effect = httpx.ConnectError("refused")
+    assert auth._probe_cloud_environment(http_client) is None
+
+    http_client.get.side_effect = KeyboardInterrupt
+    with pytest.raises(KeyboardInterrupt):
+        auth._probe_cloud_environment(http_client)
+
+
+def test_probes_run_concurrently(monkeypatch):
+    """Test the first cloud found is returned without waiting on slower probes."""
+    release = threading.Event()
+    monkeypatch.setattr(
+        auth, "_probe_gcp", lambda http_client: release.wait(5) and None
+    )
+    monkeypatch.setattr(auth, "_probe_azure", lambda http_client: None)
+    monkeypatch.setattr(auth, "_probe_aws", lambda http_client: "aws")
+
+    try:
+        assert auth._probe_cloud_environment(Mock()) == "aws"
+        assert not release.is_set()
+    finally:
+        release.set()
+
+
+def test_probes_give_up_at_detection_deadline(monkeypatch):
+    """Test a hung probe is treated as not cloud once the deadline passes."""
+    release = threading.Event()
+    monkeypatch.setattr(auth, "_DETECTION_TIMEOUT", 0.05)
+    monkeypatch.setattr(
+        auth, "_probe_gcp", lambda http_client: release.wait(5) and "gcp"
+    )
+    monkeypatch.setattr(auth, "_probe_azure", lambda http_client: None)
+    monkeypatch.setattr(auth, "_probe_aws", lambda http_client: None)
+
+    try:
+        assert auth._probe_cloud_environment(Mock()) is None
+        assert not release.is_set()
+    finally:
+        release.set()
+
+
+def test_probes_run_on_daemon_threads(monkeypatch):
+    """Test probes cannot keep the interpreter alive past the deadline."""
+    daemon = {}
+
+    def probe(name):
+        def run(http_client):
+            daemon[name] = threading.current_thread().daemon
+
+        return run
+
+    for name in ("gcp", "azure", "aws"):
+        monkeypatch.setattr(auth, f"_probe_{name}", probe(name))
+
+    assert auth._probe_cloud_environment(Mock()) is None
+    assert daemon == {"gcp": True, "azure": True, "aws": True}
+
+
+def test_aws_signer_reused_until_credentials_expire(monkeypatch):
+    """Test the SigV4 signer is built once per region and reused."""
+    monkeypatch.setattr(
+        auth, "_get_aws_credentials", lambda cache, http_client: ("key", "secret", None)
+    )
+    signer_cls = Mock()
+    credentials_cls = Mock()
+    monkeypatch.setattr(
+        auth, "_load_botocore", lambda: (signer_cls, Mock(), credentials_cls)
+    )
+    cache = _TokenStore()
+
+    first = auth._get_aws_signer(cache, Mock(), "us-east-1")
+    second = auth._get_aws_signer(cache, Mock(), "us-east-1")
+
+    assert first is second
+    assert signer_cls.call_count == 1
+    credentials_cls.assert_called_once_with("key", "secret", None)
+    assert signer_cls.call_args.kwargs["credentials"] is credentials_cls.return_value
+
+
+def test_sign_aws_request_updates_headers_in_place(monkeypatch):
+    """Test signature headers are written into the caller's headers dict."""
+
+    class FakeRequest:
+        def __init__(self, method, url, data, headers):
+            self.headers = dict(headers)
+
+    signer = Mock()
+    signer.add_auth.side_effect = lambda request: request.headers.update(
+        {"Authorization": "AWS4-HMAC-SHA256 test"}
+    )
+    monkeypatch.setattr(auth, "_load_botocore", lambda: (Mock(), FakeRequest, Mock()))
+    monkeypatch.setattr(
+        auth, "_get_aws_signer", lambda cache, http_client, region: signer
+    )
+    headers = {"Content-Type": "application/json"}
+
+    assert (
+        auth._sign_aws_request("GET", "http://api", headers, _TokenStore(), Mock())
+        is None
+    )
+    assert headers == {
+        "Content-Type": "application/json",
+        "Authorization": "AWS4-HMAC-SHA256 test",
+    }
+
+
+def test_provider_signs_with_its_own_client_and_cache(monkeypatch):
+    """Test signing fetches credentials through the provider's injected client."""
+    sign = Mock()
+    monkeypatch.setattr(auth, "_sign_aws_request", sign)
+    http_client = Mock(spec=ProductionHTTPClient)
+    provider = auth.AuthProvider("aws", http_client=http_client)
+    headers = {}
+
+    provider.sign("POST", "http://api/track", headers, body="{}")
+
+    sign.assert_called_once_with(
+        method="POST",
+        url="http://api/track",
+        headers=headers,
+        cache=provider.get_cache(),
+        http_client=http_client,
+        body="{}",
+        region="us-east-1",
+    )
+
+
+def test_aws_container_credentials_skip_instance_metadata(monkeypatch):
+    """Test ECS container credentials are fetched without probing EC2 metadata."""
+    monkeypatch.setenv("AWS_CONTAINER_CREDENTIALS_RELATIVE_URI", "/v2/credentials/abc")
+    http_client = Mock(spec=ProductionHTTPClient)
+    http_client.get.return_value = fake_response(
+        {"AccessKeyId": "key", "SecretAccessKey": "secret", "Token": "session"}
+    )
+
+    creds = auth._get_aws_credentials(_TokenStore(), http_client)
+
+    assert creds == ("key", "secret", "session")
+    http_client.get.assert_called_once()
+    assert http_client.get.call_args[0][0] == "http://169.254.170.2/v2/credentials/abc"
+
+
+def test_malformed_container_credentials_are_not_masked(monkeypatch):
+    """Test a bad credentials response raises instead of using env credentials."""
+    monkeypatch.setenv("AWS_CONTAINER_CREDENTIALS_RELATIVE_URI", "/v2/credentials/abc")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "env-key")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "env-secret")
+    http_client = Mock(spec=ProductionHTTPClient)
+    http_client.get.return_value = fake_response({"Code": "Error"})
+
+    with pytest.raises(KeyError):
+        auth._get_aws_credentials(_TokenStore(), http_client)
+
+
+def test_container_env_vars_do_not_select_aws(monkeypatch):
+    """Test detection still needs a metadata response inside AWS containers."""
+    monkeypatch.setenv("AWS_CONTAINER_CREDENTIALS_RELATIVE_URI", "/v2/credentials/abc")
+    for probe in ("_probe_gcp", "_probe_azure", "_probe_aws"):
+        monkeypatch.setattr(auth, probe, lambda http_client: None)
+
+    assert auth._probe_cloud_environment(Mock()) is None
+
+
+def _status_error(status_code):
+    request = httpx.Request("GET", "http://metadata")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def test_metadata_get_retries_server_errors(monkeypatch):
+    """Test 5xx and connection errors are retried with backoff."""
+    monkeypatch.setattr(auth.time, "sleep", lambda seconds: None)
+    http_client = Mock(spec=ProductionHTTPClient)
+    http_client.get.side_effect = make_side_effect(
+        _status_error(503), httpx.ConnectError("refused"), _token_response()
+    )
+
+    auth._metadata_get(http_client, "http://metadata")
+
+    assert http_client.get.call_count == 3
+
+
+def test_metadata_get_does_not_retry_client_errors(monkeypatch):
+    """Test 4xx errors are raised immediately."""
+    monkeypatch.setattr(auth.time, "sleep", lambda seconds: None)
+    http_client = Mock(spec=ProductionHTTPClient)
+    http_client.get.side_effect = _status_error(404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        auth._metadata_get(http_client, "http://metadata")
+
+    assert http_client.get.call_count == 1
+
+
+def test_token_store_evicts_least_recently_used():
+    """Test the token store stays bounded and evicts the oldest unused entry."""
+    store = _TokenStore(max_entries=2)
+    store.set("a", 1, 60)
+    store.set("b", 2, 60)
+    store.get("a")
+    store.set("c", 3, 60)
+
+    assert store.get("b") is None
+    assert store.get("a")[0] == 1
+    assert store.get("c")[0] == 3
+
+
+def test_service_account_file_selects_gcp_auth(tmp_path):
+    """Test a .json path that exists is treated as a GCP service account file."""
+    key_file = tmp_path / "service-account.json"
+    key_file.write_text("{}")
+
+    assert auth._classify_auth_string(str(key_file)) == "gcp"
+    assert auth._classify_auth_string("missing.json") == "bearer"
+    assert auth._classify_auth_string("my-token") == "bearer"
@@ -2,182 +2,154 @@
 Tests for the Watcher client functionality.
 """
 
-from unittest.mock import Mock, patch
+import re
+from unittest.mock import Mock
 
 import httpx
 import pytest
+from pydantic import ConfigDict
 
 from watcher.client import Watcher
-from watcher.http_client import ProductionHTTPClient
-from watcher.models.address_lineage import Address, AddressLineage
 from watcher.models.execution import ETLResult, WatcherContext
-from watcher.models.pipeline import Pipeline, PipelineConfig, SyncedPipelineConfig
+from watcher.tests.helpers import fake_response
 
+_ETL_OK = ETLResult(completed_successfully=True, inserts=100, total_rows=100)
+_CHILD_ETL_OK = ETLResult(completed_successfully=True, total_rows=100, inserts=50)
 
-def test_watcher_initialization():
-    """Test Watcher client initialization."""
-    watcher = Watcher("https://api.example.com")
-    assert watcher.base_url == "https://api.example.com"
-    assert isinstance(watcher.client, ProductionHTTPClient)
+# Raised by the tracking decorators when the ETL function returns a non-ETLResult
+_ETL_RETURN_RE = re.compile("Function must return ETLResult")
 
+_MOCK_START = fake_response({"id": 456})
+_MOCK_END = fake_response({"status": "success"})
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
-def test_sync_pipeline_config_success(
-    mock_request_with_retry, watcher_client, sample_pipeline_config
-):
-    """Test successful pipeline sync."""
-    # Mock API responses
-    mock_pipeline_response = Mock()
-    mock_pipeline_response.json.return_value = {
-        "id": 123,
-        "active": True,
-        "load_lineage": True,
-        "watermark": "2024-01-01",
-    }
-    mock_pipeline_response.raise_for_status.return_value = None
-
-    mock_lineage_response = Mock()
-    mock_lineage_response.raise_for_status.return_value = None
-
-    mock_request_with_retry.side_effect = [
-        mock_pipeline_response,
-        mock_lineage_response,
-    ]
+_CTX = WatcherContext(
+    execution_id=123,
+    pipeline_id=456,
+    watermark="2024-01-01",
+    next_watermark="2024-01-02",
+)
+_METRICS = ETLResult(
+    completed_successfully=True,
+    inserts=100,
+    updates=50,
+    soft_deletes=10,
+    total_rows=1000,
+    execution_metadata={"source": "database"},
+)
 
-    result = watcher_client.sync_pipeline_config(sample_pipeline_config)
 
-    assert isinstance(result, SyncedPipelineConfig)
-    assert result.pipeline.active is True
-    assert result.watermark == "2024-01-01"
-    assert mock_request_with_retry.call_count == 2  # Pipeline + address lineage
+class CustomMetrics(ETLResult):
+    model_config = ConfigDict(frozen=True)
 
+    custom_field: str = "test"
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
-def test_sync_pipeline_config_inactive(
-    mock_request_with_retry, watcher_client, sample_pipeline_config
-):
-    """Test pipeline sync when pipeline is inactive."""
-    # Mock inactive pipeline response
-    mock_response = Mock()
-    mock_response.json.return_value = {
-        "id": 123,
-        "active": False,
-        "load_lineage": True,
-        "watermark": None,
-    }
-    mock_response.raise_for_status.return_value = None
-    mock_request_with_retry.return_value = mock_response
 
-    result = watcher_client.sync_pipeline_config(sample_pipeline_config)
-
-    assert isinstance(result, SyncedPipelineConfig)
-    assert result.pipeline.active is False
-    assert result.watermark is None  # Inactive pipelines have no watermark
-    assert mock_request_with_retry.call_count == 1  # Only pipeline call, no lineage
-
-
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
-def test_sync_pipeline_config_no_lineage(
-    mock_request_with_retry, watcher_client, sample_pipeline_config
+@pytest.mark.parametrize(
+    "base_url",
+    ["https://api.example.com", "https://api.example.com/v2", "http://localhost:8000"],
+)
+def test_watcher_initialization(monkeypatch, base_url):
+    """Test Watcher client initialization."""
+    # Only the wiring is under test, so skip building a real connection pool
+    # and the auth provider, whose cloud detection is cached process-wide
+    http_client_cls = Mock()
+    create_auth_provider = Mock()
+    monkeypatch.setattr("watcher.client.ProductionHTTPClient", http_client_cls)
+    monkeypatch.setattr("watcher.client._create_auth_provider", create_auth_provider)
+
+    watcher = Watcher(base_url)
+
+    assert watcher.base_url == base_url
+    assert watcher.client is http_client_cls.return_value
+    assert watcher.auth_provider is create_auth_provider.return_value
+    http_client_cls.assert_called_once_with(base_url=base_url)
+    create_auth_provider.assert_called_once_with(None)
+
+
+@pytest.mark.parametrize(
+    "response_key,expected_calls,expected_active,expected_watermark",
+    [
+        # Active pipeline syncs its address lineage too
+        ("pipeline_success", 2, True, "2024-01-01"),
+        # Inactive pipelines skip lineage and have no watermark
+        ("pipeline_inactive", 1, False, None),
+        # load_lineage=False skips the lineage call
+        ("pipeline_no_lineage", 1, True, "2024-01-01"),
+    ],
+    ids=["success", "inactive", "no_lineage"],
+)
+def test_sync_pipeline_config(
+    patched_request,
+    watcher_client,
+    sample_pipeline_config,
+    mock_api_responses,
+    response_key,
+    expected_calls,
+    expected_active,
+    expected_watermark,
 ):
-    """Test pipeline sync when load_lineage is False."""
-    # Mock pipeline response with load_lineage=False
-    mock_response = Mock()
-    mock_response.json.return_value = {
-        "id": 123,
-        "active": True,
-        "load_lineage": False,
-        "watermark": "2024-01-01",
-    }
-    mock_response.raise_for_status.return_value = None
-    mock_request_with_retry.return_value = mock_response
+    """Test pipeline sync for active, inactive and lineage-less pipelines."""
+    payload = mock_api_responses[response_key]
+    # The lineage response body is never read, so the same response is reused
+    calls = patched_request([fake_response(payload)] * expected_calls)
 
     result = watcher_client.sync_pipeline_config(sample_pipeline_config)
 
-    assert isinstance(result, SyncedPipelineConfig)
-    assert result.pipeline.active is True
-    assert mock_request_with_retry.call_count == 1  # Only pipeline call
+    assert result.pipeline.active is expected_active
+    assert result.watermark == expected_watermark
+    assert len(calls) == expected_calls
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
-def test_track_pipeline_execution_decorator_without_context(
-    mock_request_with_retry, watcher_client
-):
-    """Test execution decorator without watcher_context parameter."""
-    # Mock API responses
-    mock_start = Mock()
-    mock_start.json.return_value = {"id": 456}
-    mock_start.raise_for_status.return_value = None
-
-    mock_end = Mock()
-    mock_end.raise_for_status.return_value = None
+@pytest.fixture
+def tracked(watcher_client):
+    """Wrap a function with track_pipeline_execution for pipeline 123."""
 
-    mock_request_with_retry.side_effect = [mock_start, mock_end]
+    def wrap(func, active=True, pipeline_id=123):
+        return watcher_client.track_pipeline_execution(
+            pipeline_id=pipeline_id, active=active
+        )(func)
 
-    @watcher_client.track_pipeline_execution(pipeline_id=123, active=True)
-    def simple_etl():
-        return ETLResult(completed_successfully=True, inserts=100, total_rows=100)
-
-    # This should work without watcher_context parameter
-    result = simple_etl()
-    assert result is not None
+    return wrap
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
-def test_track_pipeline_execution_decorator_with_context(
-    mock_request_with_retry, watcher_client
-):
-    """Test execution decorator with watcher_context parameter."""
-    # Mock API responses
-    mock_start = Mock()
-    mock_start.json.return_value = {"id": 456}
-    mock_start.raise_for_status.return_value = None
+def _etl_without_context():
+    return _ETL_OK
 
-    mock_end = Mock()
-    mock_end.raise_for_status.return_value = None
 
-    mock_request_with_retry.side_effect = [mock_start, mock_end]
+def _etl_with_context(watcher_context: WatcherContext):
+    assert isinstance(watcher_context, WatcherContext)
+    assert watcher_context.pipeline_id == 123
+    return _ETL_OK
 
-    @watcher_client.track_pipeline_execution(pipeline_id=123, active=True)
-    def etl_with_context(watcher_context: WatcherContext):
-        assert isinstance(watcher_context, WatcherContext)
-        assert watcher_context.pipeline_id == 123
-        return ETLResult(completed_successfully=True, inserts=100, total_rows=100)
 
-    # This should work with watcher_context parameter
-    result = etl_with_context()
+@pytest.mark.parametrize(
+    "etl_func",
+    [_etl_without_context, _etl_with_context],
+    ids=["without_context", "with_context"],
+)
+@pytest.mark.usefixtures("block_network")
+def test_track_pipeline_execution_decorator(tracked, etl_func):
+    """Test execution decorator with and without a watcher_context parameter."""
+    result = tracked(etl_func)()
     assert result is not None
 
 
-def test_track_pipeline_execution_inactive_pipeline(watcher_client):
+def test_track_pipeline_execution_inactive_pipeline(patched_request, tracked):
     """Test execution decorator with inactive pipeline."""
+    calls = patched_request([])
 
-    @watcher_client.track_pipeline_execution(pipeline_id=123, active=False)
-    def etl_inactive():
-        return ETLResult(completed_successfully=True, inserts=100, total_rows=100)
+    result = tracked(_etl_without_context, active=False)()
 
-    # Should return None for inactive pipeline
-    result = etl_inactive()
+    # Should return None and not make API calls
     assert result is None
+    assert len(calls) == 0
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
-def test_etl_metrics_validation(mock_request_with_retry, watcher_client):
+@pytest.mark.usefixtures("block_network")
+def test_etl_metrics_validation(tracked):
     """Test ETLResult validation in decorator."""
-    # Mock API responses
-    mock_start = Mock()
-    mock_start.json.return_value = {"id": 456}
-    mock_start.raise_for_status.return_value = None
-
-    mock_end = Mock()
-    mock_end.raise_for_status.return_value = None
-
-    mock_request_with_retry.side_effect = [mock_start, mock_end]
 
-    class CustomMetrics(ETLResult):
-        custom_field: str = "test"
-
-    @watcher_client.track_pipeline_execution(pipeline_id=123, active=True)
+    @tracked
     def etl_with_custom_metrics():
         return CustomMetrics(
             completed_successfully=True, inserts=100, custom_field="hello"
@@ -188,116 +160,54 @@ def test_etl_metrics_validation(mock_request_with_retry, watcher_client):
     assert result is not None
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
-def test_etl_metrics_validation_failure(mock_request_with_retry, watcher_client):
+@pytest.mark.usefixtures("block_network")
+def test_etl_metrics_validation_failure(tracked):
     """Test ETLResult validation failure."""
-    # Mock API responses
-    mock_start = Mock()
-    mock_start.json.return_value = {"id": 456}
-    mock_start.raise_for_status.return_value = None
-
-    mock_request_with_retry.return_value = mock_start
 
-    @watcher_client.track_pipeline_execution(pipeline_id=123, active=True)
+    @tracked
     def etl_invalid_return():
         return {"inserts": 100}  # Not ETLResult
 
     # Should raise ValueError for invalid return type
-    with pytest.raises(ValueError, match="Function must return ETLResult"):
+    with pytest.raises(ValueError, match=_ETL_RETURN_RE):
         etl_invalid_return()
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
-def test_execution_error_handling(mock_request_with_retry, watcher_client):
+def test_execution_error_handling(mock_request_with_retry, tracked):
     """Test execution error handling."""
     # Mock API failure
     mock_request_with_retry.side_effect = httpx.HTTPError("API Error")
 
-    @watcher_client.track_pipeline_execution(pipeline_id=123, active=True)
+    @tracked
     def etl_with_error():
-        return ETLResult(completed_successfully=True, inserts=100)
+        return _ETL_OK
 
     # Should propagate the HTTP error
     with pytest.raises(httpx.HTTPError):
         etl_with_error()
 
 
-def test_execution_context_fields():
-    """Test WatcherContext contains expected fields."""
-    context = WatcherContext(
-        execution_id=123,
-        pipeline_id=456,
-        watermark="2024-01-01",
-        next_watermark="2024-01-02",
-    )
-
-    assert context.execution_id == 123
-    assert context.pipeline_id == 456
-    assert context.watermark == "2024-01-01"
-    assert context.next_watermark == "2024-01-02"
-
-
-def test_etl_metrics_fields():
-    """Test ETLResult contains expected fields."""
-    metrics = ETLResult(
-        completed_successfully=True,
-        inserts=100,
-        updates=50,
-        soft_deletes=10,
-        total_rows=1000,
-        execution_metadata={"source": "database"},
-    )
+def test_model_smoke(sample_pipeline_config):
+    """Test WatcherContext, ETLResult and PipelineConfig keep their fields."""
+    assert _CTX.execution_id == 123
+    assert _CTX.pipeline_id == 456
+    assert _CTX.watermark == "2024-01-01"
+    assert _CTX.next_watermark == "2024-01-02"
 
-    assert metrics.inserts == 100
-    assert metrics.updates == 50
-    assert metrics.soft_deletes == 10
-    assert metrics.total_rows == 1000
-    assert metrics.execution_metadata == {"source": "database"}
-
-
-def test_pipeline_config_creation():
-    """Test PipelineConfig creation and validation."""
-    config = PipelineConfig(
-        pipeline=Pipeline(
-            name="test-pipeline",
-            pipeline_type_name="data-transformation",
-            default_watermark="2024-01-01",
-        ),
-        address_lineage=AddressLineage(
-            source_addresses=[
-                Address(
-                    name="source-db",
-                    address_type_name="database",
-                    address_type_group_name="rdbms",
-                )
-            ],
-            target_addresses=[
-                Address(
-                    name="target-warehouse",
-                    address_type_name="data-warehouse",
-                    address_type_group_name="analytics",
-                )
-            ],
-        ),
-    )
+    assert _METRICS.inserts == 100
+    assert _METRICS.updates == 50
+    assert _METRICS.soft_deletes == 10
+    assert _METRICS.total_rows == 1000
+    assert _METRICS.execution_metadata == {"source": "database"}
 
-    assert config.pipeline.name == "test-pipeline"
-    assert len(config.address_lineage.source_addresses) == 1
-    assert len(config.address_lineage.target_addresses) == 1
+    assert sample_pipeline_config.pipeline.name == "test-pipeline"
+    assert len(sample_pipeline_config.address_lineage.source_addresses) == 1
+    assert len(sample_pipeline_config.address_lineage.target_addresses) == 1
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
-def test_track_child_pipeline_execution_success(
-    mock_request_with_retry, watcher_client
-):
+def test_track_child_pipeline_execution_success(patched_request, watcher_client):
     """Test successful child pipeline execution tracking."""
-    # Mock API responses
-    mock_start_response = Mock()
-    mock_start_response.json.return_value = {"id": 456}
-    mock_end_response = Mock()
-    mock_end_response.json.return_value = {"status": "success"}
-
-    mock_request_with_retry.side_effect = [mock_start_response, mock_end_response]
+    calls = patched_request([_MOCK_START, _MOCK_END])
 
     # Test function
     def child_function(watcher_context: WatcherContext, data):
@@ -305,7 +215,7 @@ def test_track_child_pipeline_execution_success(
         assert watcher_context.pipeline_id == 789
         assert watcher_context.watermark == "2024-01-01"
         assert watcher_context.next_watermark == "2024-01-02"
-        return ETLResult(completed_successfully=True, total_rows=100, inserts=50)
+        return _CHILD_ETL_OK
 
     # Call the method
     result = watcher_client.track_child_pipeline_execution(
@@ -319,10 +229,10 @@ def test_track_child_pipeline_execution_success(
     )
 
     # Verify API calls
-    assert mock_request_with_retry.call_count == 2
+    assert len(calls) == 2
 
     # Check start execution call
-    start_call = mock_request_with_retry.call_args_list[0]
+    start_call = calls[0]
     assert start_call[0][0] == "POST"
     assert start_call[0][1] == "/start_pipeline_execution"
     start_payload = start_call[1]["json"]
@@ -332,7 +242,7 @@ def test_track_child_pipeline_execution_success(
     assert start_payload["next_watermark"] == "2024-01-02"
 
     # Check end execution call
-    end_call = mock_request_with_retry.call_args_list[1]
+    end_call = calls[1]
     assert end_call[0][0] == "POST"
     assert end_call[0][1] == "/end_pipeline_execution"
     end_payload = end_call[1]["json"]
@@ -347,18 +257,11 @@ def test_track_child_pipeline_execution_success(
     assert result.result.total_rows == 100
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
 def test_track_child_pipeline_execution_without_watcher_context(
-    mock_request_with_retry, watcher_client
+    patched_request, watcher_client
 ):
     """Test child pipeline execution without WatcherContext parameter."""
-    # Mock API responses
-    mock_start_response = Mock()
-    mock_start_response.json.return_value = {"id": 456}
-    mock_end_response = Mock()
-    mock_end_response.json.return_value = {"status": "success"}
-
-    mock_request_with_retry.side_effect = [mock_start_response, mock_end_response]
+    patched_request([_MOCK_START, _MOCK_END])
 
     # Test function without WatcherContext
     def child_function(data):
@@ -379,36 +282,30 @@ def test_track_child_pipeline_execution_without_watcher_context(
     assert result.result.total_rows == 200
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
 def test_track_child_pipeline_execution_inactive_pipeline(
-    mock_request_with_retry, watcher_client
+    patched_request, watcher_client
 ):
     """Test child pipeline execution with inactive pipeline."""
+    calls = patched_request([])
+
     # Call the method with active=False
     result = watcher_client.track_child_pipeline_execution(
         pipeline_id=789,
         active=False,
         parent_execution_id=123,
-        func=lambda: ETLResult(completed_successfully=True, total_rows=100),
+        func=lambda: _ETL_OK,
     )
 
     # Should return None and not make API calls
     assert result is None
-    assert mock_request_with_retry.call_count == 0
+    assert len(calls) == 0
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
 def test_track_child_pipeline_execution_function_exception(
-    mock_request_with_retry, watcher_client
+    patched_request, watcher_client
 ):
     """Test child pipeline execution when function raises exception."""
-    # Mock API responses
-    mock_start_response = Mock()
-    mock_start_response.json.return_value = {"id": 456}
-    mock_end_response = Mock()
-    mock_end_response.json.return_value = {"status": "success"}
-
-    mock_request_with_retry.side_effect = [mock_start_response, mock_end_response]
+    calls = patched_request([_MOCK_START, _MOCK_END])
 
     # Test function that raises exception
     def child_function():
@@ -421,51 +318,35 @@ def test_track_child_pipeline_execution_function_exception(
         )
 
     # Verify API calls were made
-    assert mock_request_with_retry.call_count == 2
+    assert len(calls) == 2
 
     # Check that end execution was called with failure
-    end_call = mock_request_with_retry.call_args_list[1]
+    end_call = calls[1]
     end_payload = end_call[1]["json"]
     assert end_payload["id"] == 456
     assert end_payload["completed_successfully"] is False
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
-def test_track_child_pipeline_execution_invalid_return_type(
-    mock_request_with_retry, watcher_client
-):
+@pytest.mark.usefixtures("block_network")
+def test_track_child_pipeline_execution_invalid_return_type(watcher_client):
     """Test child pipeline execution with invalid return type."""
-    # Mock API responses
-    mock_start_response = Mock()
-    mock_start_response.json.return_value = {"id": 456}
-    mock_end_response = Mock()
-    mock_end_response.json.return_value = {"status": "success"}
-
-    mock_request_with_retry.side_effect = [mock_start_response, mock_end_response]
 
     # Test function that returns invalid type
     def child_function():
         return "not an ETLResult"
 
     # Should raise ValueError
-    with pytest.raises(ValueError, match="Function must return ETLResult"):
+    with pytest.raises(ValueError, match=_ETL_RETURN_RE):
         watcher_client.track_child_pipeline_execution(
             pipeline_id=789, active=True, parent_execution_id=123, func=child_function
         )
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
 def test_track_child_pipeline_execution_with_execution_metadata(
-    mock_request_with_retry, watcher_client
+    patched_request, watcher_client
 ):
     """Test child pipeline execution with execution metadata."""
-    # Mock API responses
-    mock_start_response = Mock()
-    mock_start_response.json.return_value = {"id": 456}
-    mock_end_response = Mock()
-    mock_end_response.json.return_value = {"status": "success"}
-
-    mock_request_with_retry.side_effect = [mock_start_response, mock_end_response]
+    calls = patched_request([_MOCK_START, _MOCK_END])
 
     # Test function
     def child_function():
@@ -481,7 +362,7 @@ def test_track_child_pipeline_execution_with_execution_metadata(
     )
 
     # Check end execution call includes metadata
-    end_call = mock_request_with_retry.call_args_list[1]
+    end_call = calls[1]
     end_payload = end_call[1]["json"]
     assert end_payload["execution_metadata"] == {"ticker": "AAPL", "batch_id": "123"}
 
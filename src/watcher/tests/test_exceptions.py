@@ -1,104 +1,120 @@
-from unittest.mock import Mock, patch
+import json
+from types import SimpleNamespace
 
 import httpx
 import pytest
 
 from watcher import WatcherAPIError, WatcherNetworkError
+from watcher.tests.helpers import fake_response
+
+
+def _not_json():
+    raise ValueError("Not JSON")
+
+
+# Error bodies and prebuilt errors raised by the patched HTTP layer
+
+_ERR_PAYLOAD = {
+    "error": "Pipeline not found",
+    "message": "Pipeline with ID 123 does not exist",
+    "code": "PIPELINE_NOT_FOUND",
+}
+_ERR_JSON = json.dumps(_ERR_PAYLOAD)
+_LONG_TEXT = "x" * 300
+
+# 404 response with API error details
+_404_ERR = httpx.HTTPStatusError(
+    "404 Not Found",
+    request=SimpleNamespace(),
+    response=fake_response(
+        _ERR_PAYLOAD,
+        status=404,
+        text=_ERR_JSON,
+        headers={"content-type": "application/json"},
+    ),
+)
+
+# 500 response without JSON
+_500_ERR = httpx.HTTPStatusError(
+    "500 Internal Server Error",
+    request=SimpleNamespace(),
+    response=SimpleNamespace(
+        status_code=500,
+        text="Internal Server Error",
+        headers={"content-type": "text/plain"},
+        json=_not_json,
+    ),
+)
+
+_CONN_ERR = httpx.ConnectError("Connection failed")
+
+
+def test_api_error_handling(
+    mock_request_with_retry, watcher_client, sample_pipeline_config
+):
+    """Test that API errors are properly converted to WatcherAPIError."""
+    mock_request_with_retry.side_effect = _404_ERR
 
+    with pytest.raises(WatcherAPIError) as exc_info:
+        watcher_client.sync_pipeline_config(sample_pipeline_config)
 
-def test_api_error_handling(watcher_client, sample_pipeline_config):
-    """Test that API errors are properly converted to WatcherAPIError."""
-    # Mock a 404 response with API error details
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_response.text = '{"error": "Pipeline not found", "message": "Pipeline with ID 123 does not exist", "code": "PIPELINE_NOT_FOUND"}'
-    mock_response.headers = {"content-type": "application/json"}
-    mock_response.json.return_value = {
-        "error": "Pipeline not found",
-        "message": "Pipeline with ID 123 does not exist",
-        "code": "PIPELINE_NOT_FOUND",
-    }
-
-    # Mock httpx.HTTPStatusError
-    http_error = httpx.HTTPStatusError(
-        "404 Not Found", request=Mock(), response=mock_response
-    )
-
-    with patch.object(
-        watcher_client.client, "request_with_retry", side_effect=http_error
-    ):
-        with pytest.raises(WatcherAPIError) as exc_info:
-            watcher_client.sync_pipeline_config(sample_pipeline_config)
-
-        # Verify the exception has the correct details
-        assert exc_info.value.status_code == 404
-        assert exc_info.value.error_code == "PIPELINE_NOT_FOUND"
-        assert "Pipeline with ID 123 does not exist" in str(exc_info.value)
-
-
-def test_network_error_handling(watcher_client, sample_pipeline_config):
+    # Verify the exception has the correct details
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.error_code == "PIPELINE_NOT_FOUND"
+    assert "Pipeline with ID 123 does not exist" in str(exc_info.value)
+
+
+def test_network_error_handling(
+    mock_request_with_retry, watcher_client, sample_pipeline_config
+):
     """Test that network errors are properly converted to WatcherNetworkError."""
-    # Mock a network error
-    network_error = httpx.ConnectError("Connection failed")
+    mock_request_with_retry.side_effect = _CONN_ERR
 
-    with patch.object(
-        watcher_client.client, "request_with_retry", side_effect=network_error
-    ):
-        with pytest.raises(WatcherNetworkError) as exc_info:
-            watcher_client.sync_pipeline_config(sample_pipeline_config)
+    with pytest.raises(WatcherNetworkError) as exc_info:
+        watcher_client.sync_pipeline_config(sample_pipeline_config)
 
-        # Verify the exception message
-        assert "Network error" in str(exc_info.value)
-        assert "Connection failed" in str(exc_info.value)
+    # Verify the exception message
+    assert "Network error" in str(exc_info.value)
+    assert "Connection failed" in str(exc_info.value)
 
 
-def test_api_error_without_json_response(watcher_client, sample_pipeline_config):
+def test_api_error_without_json_response(
+    mock_request_with_retry, watcher_client, sample_pipeline_config
+):
     """Test API error handling when response is not JSON."""
-    # Mock a 500 response without JSON
-    mock_response = Mock()
-    mock_response.status_code = 500
-    mock_response.text = "Internal Server Error"
-    mock_response.headers = {"content-type": "text/plain"}
-    mock_response.json.side_effect = ValueError("Not JSON")
-
-    # Mock httpx.HTTPStatusError
-    http_error = httpx.HTTPStatusError(
-        "500 Internal Server Error", request=Mock(), response=mock_response
-    )
-
-    with patch.object(
-        watcher_client.client, "request_with_retry", side_effect=http_error
-    ):
-        with pytest.raises(WatcherAPIError) as exc_info:
-            watcher_client.sync_pipeline_config(sample_pipeline_config)
-
-        # Verify the exception has the correct details
-        assert exc_info.value.status_code == 500
-        assert exc_info.value.response_text == "Internal Server Error"
-        assert "Internal Server Error" in str(exc_info.value)
-
-
-def test_watcher_api_error_str_representation():
+    mock_request_with_retry.side_effect = _500_ERR
+
+    with pytest.raises(WatcherAPIError) as exc_info:
+        watcher_client.sync_pipeline_config(sample_pipeline_config)
+
+    # Verify the exception has the correct details
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.response_text == "Internal Server Error"
+    assert "Internal Server Error" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected_substrings,max_len",
+    [
+        (
+            {"message": "Test error", "status_code": 404, "error_code": "NOT_FOUND"},
+            ["Test error", "HTTP 404", "[NOT_FOUND]"],
+            None,
+        ),
+        # Long response text should be truncated in the string representation
+        (
+            {"message": "Test error", "status_code": 500, "response_text": _LONG_TEXT},
+            ["Test error", "HTTP 500"],
+            300,
+        ),
+    ],
+    ids=["error_code", "long_response_text"],
+)
+def test_watcher_api_error_str_representation(kwargs, expected_substrings, max_len):
     """Test WatcherAPIError string representation."""
-    error = WatcherAPIError(
-        message="Test error", status_code=404, error_code="NOT_FOUND"
-    )
-
-    error_str = str(error)
-    assert "Test error" in error_str
-    assert "HTTP 404" in error_str
-    assert "[NOT_FOUND]" in error_str
-
-
-def test_watcher_api_error_with_long_response_text():
-    """Test WatcherAPIError with long response text (should be truncated)."""
-    long_text = "x" * 300  # 300 characters
-    error = WatcherAPIError(
-        message="Test error", status_code=500, response_text=long_text
-    )
-
-    error_str = str(error)
-    assert "Test error" in error_str
-    assert "HTTP 500" in error_str
-    # Long text should be truncated in string representation
-    assert len(error_str) < 300
+    error_str = str(WatcherAPIError(**kwargs))
+
+    for substring in expected_substrings:
+        assert substring in error_str
+    if max_len is not None:
+        assert len(error_str) < max_len
@@ -1,13 +1,27 @@
-from unittest.mock import Mock, patch
-
 import pytest
+from pydantic import ConfigDict
 
 from watcher.models.address_lineage import Address, AddressLineage
 from watcher.models.execution import ETLResult, WatcherContext
 from watcher.models.pipeline import Pipeline, PipelineConfig, SyncedPipelineConfig
+from watcher.tests.helpers import fake_response
+
+PIPELINE_OK = fake_response(
+    {"id": 123, "active": True, "load_lineage": True, "watermark": "2024-01-01"}
+)
+LINEAGE_OK = fake_response()
+EXEC_START = fake_response({"id": 456})
+EXEC_END = fake_response()
+
+
+class CustomMetrics(ETLResult):
+    model_config = ConfigDict(frozen=True)
 
+    custom_field: str = "test"
+    processing_time: float = 0.0
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def integration_pipeline():
     """Create a complete pipeline configuration for integration testing."""
     return Pipeline(
@@ -18,7 +32,7 @@ def integration_pipeline():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def integration_address_lineage():
     """Create address lineage for integration testing."""
     return AddressLineage(
@@ -39,7 +53,7 @@ def integration_address_lineage():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def integration_config(integration_pipeline, integration_address_lineage):
     """Create complete pipeline config for integration testing."""
     return PipelineConfig(
@@ -47,40 +61,16 @@ def integration_config(integration_pipeline, integration_address_lineage):
     )
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
-def test_complete_etl_workflow(
-    mock_request_with_retry, watcher_client, integration_config
-):
+def test_complete_etl_workflow(patched_request, watcher_client, integration_config):
     """Test complete ETL workflow from sync to execution."""
-    # Mock successful pipeline sync
-    mock_pipeline_response = Mock()
-    mock_pipeline_response.json.return_value = {
-        "id": 123,
-        "active": True,
-        "load_lineage": True,
-        "watermark": "2024-01-01",
-    }
-    mock_pipeline_response.raise_for_status.return_value = None
-
-    # Mock successful address lineage sync
-    mock_lineage_response = Mock()
-    mock_lineage_response.raise_for_status.return_value = None
-
-    # Mock execution start
-    mock_execution_start = Mock()
-    mock_execution_start.json.return_value = {"id": 456}
-    mock_execution_start.raise_for_status.return_value = None
-
-    # Mock execution end
-    mock_execution_end = Mock()
-    mock_execution_end.raise_for_status.return_value = None
-
-    mock_request_with_retry.side_effect = [
-        mock_pipeline_response,  # Pipeline sync
-        mock_lineage_response,  # Address lineage sync
-        mock_execution_start,  # Start execution
-        mock_execution_end,  # End execution
-    ]
+    calls = patched_request(
+        [
+            PIPELINE_OK,  # Pipeline sync
+            LINEAGE_OK,  # Address lineage sync
+            EXEC_START,  # Start execution
+            EXEC_END,  # End execution
+        ]
+    )
 
     # Step 1: Sync pipeline configuration
     synced_config = watcher_client.sync_pipeline_config(integration_config)
@@ -122,41 +112,31 @@ def test_complete_etl_workflow(
     assert result.result.total_rows == 1200
 
     # Verify all API calls were made
-    assert mock_request_with_retry.call_count == 4
+    assert len(calls) == 4
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
 def test_pipeline_chaining_workflow(
-    mock_request_with_retry, watcher_client, integration_address_lineage
+    patched_request, watcher_client, integration_address_lineage
 ):
     """Test pipeline chaining workflow."""
     # Mock responses for parent pipeline
-    mock_parent_pipeline = Mock()
-    mock_parent_pipeline.json.return_value = {
-        "id": 100,
-        "active": True,
-        "load_lineage": True,
-        "watermark": "2024-01-01",
-    }
-    mock_parent_pipeline.raise_for_status.return_value = None
-
-    mock_parent_lineage = Mock()
-    mock_parent_lineage.raise_for_status.return_value = None
-
-    # Mock execution responses
-    mock_execution_start = Mock()
-    mock_execution_start.json.return_value = {"id": 456}
-    mock_execution_start.raise_for_status.return_value = None
-
-    mock_execution_end = Mock()
-    mock_execution_end.raise_for_status.return_value = None
-
-    mock_request_with_retry.side_effect = [
-        mock_parent_pipeline,  # Parent pipeline sync
-        mock_parent_lineage,  # Parent address lineage sync
-        mock_execution_start,  # Start parent execution
-        mock_execution_end,  # End parent execution
-    ]
+    mock_parent_pipeline = fake_response(
+        {
+            "id": 100,
+            "active": True,
+            "load_lineage": True,
+            "watermark": "2024-01-01",
+        }
+    )
+
+    calls = patched_request(
+        [
+            mock_parent_pipeline,  # Parent pipeline sync
+            LINEAGE_OK,  # Parent address lineage sync
+            EXEC_START,  # Start parent execution
+            EXEC_END,  # End parent execution
+        ]
+    )
 
     # Create parent pipeline config
     parent_config = PipelineConfig(
@@ -184,24 +164,23 @@ def test_pipeline_chaining_workflow(
     assert parent_result.execution_id == 456
 
     # Verify API calls were made
-    assert mock_request_with_retry.call_count == 4
+    assert len(calls) == 4
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
 def test_inactive_pipeline_workflow(
-    mock_request_with_retry, watcher_client, integration_config
+    patched_request, watcher_client, integration_config
 ):
     """Test workflow with inactive pipeline."""
     # Mock inactive pipeline response
-    mock_response = Mock()
-    mock_response.json.return_value = {
-        "id": 123,
-        "active": False,
-        "load_lineage": True,
-        "watermark": None,
-    }
-    mock_response.raise_for_status.return_value = None
-    mock_request_with_retry.return_value = mock_response
+    mock_response = fake_response(
+        {
+            "id": 123,
+            "active": False,
+            "load_lineage": True,
+            "watermark": None,
+        }
+    )
+    calls = patched_request([mock_response])
 
     # Sync inactive pipeline
     synced_config = watcher_client.sync_pipeline_config(integration_config)
@@ -220,25 +199,12 @@ def test_inactive_pipeline_workflow(
     assert result is None
 
     # Only pipeline sync call should be made, no execution calls
-    assert mock_request_with_retry.call_count == 1
+    assert len(calls) == 1
 
 
-@patch("watcher.client.ProductionHTTPClient.request_with_retry")
-def test_custom_metrics_workflow(mock_request_with_retry, watcher_client):
+def test_custom_metrics_workflow(patched_request, watcher_client):
     """Test workflow with custom ETLResult."""
-    # Mock API responses
-    mock_start = Mock()
-    mock_start.json.return_value = {"id": 456}
-    mock_start.raise_for_status.return_value = None
-
-    mock_end = Mock()
-    mock_end.raise_for_status.return_value = None
-
-    mock_request_with_retry.side_effect = [mock_start, mock_end]
-
-    class CustomMetrics(ETLResult):
-        custom_field: str = "test"
-        processing_time: float = 0.0
+    patched_request([EXEC_START, EXEC_END])
 
     @watcher_client.track_pipeline_execution(pipeline_id=123, active=True)
     def etl_with_custom_metrics():
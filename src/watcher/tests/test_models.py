@@ -1,5 +1,5 @@
 import pytest
-from pydantic import ValidationError
+from pydantic import ConfigDict, TypeAdapter, ValidationError
 
 from watcher.models.address_lineage import Address, AddressLineage
 from watcher.models.execution import (
@@ -14,6 +14,55 @@ from watcher.models.pipeline import (
     _PipelineWithResponse,
 )
 
+pytestmark = pytest.mark.filterwarnings("error::DeprecationWarning")
+
+_ETL_ADAPTER = TypeAdapter(ETLResult)
+_PIPELINE_ADAPTER = TypeAdapter(Pipeline)
+_ADDRESS_ADAPTER = TypeAdapter(Address)
+_LINEAGE_ADAPTER = TypeAdapter(AddressLineage)
+_CONTEXT_ADAPTER = TypeAdapter(WatcherContext)
+
+
+class CustomMetrics(ETLResult):
+    model_config = ConfigDict(frozen=True)
+
+    custom_field: str = "test"
+    another_field: int = 42
+
+
+@pytest.fixture(scope="module")
+def source_address():
+    """Create a source Address for testing."""
+    return Address(
+        name="source-db",
+        address_type_name="database",
+        address_type_group_name="rdbms",
+    )
+
+
+@pytest.fixture(scope="module")
+def target_address():
+    """Create a target Address for testing."""
+    return Address(
+        name="target-warehouse",
+        address_type_name="data-warehouse",
+        address_type_group_name="analytics",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_lineage(source_address, target_address):
+    """Create an AddressLineage for testing."""
+    return AddressLineage(
+        source_addresses=[source_address], target_addresses=[target_address]
+    )
+
+
+@pytest.fixture(scope="module")
+def basic_pipeline():
+    """Create a Pipeline with only the required fields for testing."""
+    return Pipeline(name="test-pipeline", pipeline_type_name="data-transformation")
+
 
 def test_etl_metrics_creation():
     """Test ETLResult creation with all fields."""
@@ -46,29 +95,24 @@ def test_etl_metrics_optional_fields():
     assert metrics.execution_metadata is None
 
 
-def test_etl_metrics_validation():
-    """Test ETLResult field validation."""
-    # Test negative values are rejected
-    with pytest.raises(ValidationError):
-        ETLResult(completed_successfully=True, inserts=-1)
-
-    with pytest.raises(ValidationError):
-        ETLResult(completed_successfully=True, updates=-5)
-
-    with pytest.raises(ValidationError):
-        ETLResult(completed_successfully=True, soft_deletes=-2)
-
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"completed_successfully": True, "inserts": -1},
+        {"completed_successfully": True, "updates": -5},
+        {"completed_successfully": True, "soft_deletes": -2},
+        {"completed_successfully": True, "total_rows": -10},
+    ],
+    ids=["inserts", "updates", "soft_deletes", "total_rows"],
+)
+def test_etl_metrics_rejects_negative(data):
+    """Test ETLResult rejects negative row counts."""
     with pytest.raises(ValidationError):
-        ETLResult(completed_successfully=True, total_rows=-10)
+        _ETL_ADAPTER.validate_python(data)
 
 
 def test_etl_metrics_inheritance():
     """Test extending ETLResult."""
-
-    class CustomMetrics(ETLResult):
-        custom_field: str = "test"
-        another_field: int = 42
-
     metrics = CustomMetrics(
         completed_successfully=True, inserts=100, custom_field="hello"
     )
@@ -105,14 +149,15 @@ def test_execution_context_optional_fields():
     assert context.next_watermark is None
 
 
-def test_execution_context_validation():
-    """Test WatcherContext field validation."""
-    # Test required fields
-    with pytest.raises(ValidationError):
-        WatcherContext(execution_id=123)  # Missing pipeline_id
-
+@pytest.mark.parametrize(
+    "data",
+    [{"execution_id": 123}, {"pipeline_id": 456}],
+    ids=["missing_pipeline_id", "missing_execution_id"],
+)
+def test_execution_context_validation(data):
+    """Test WatcherContext required fields."""
     with pytest.raises(ValidationError):
-        WatcherContext(pipeline_id=456)  # Missing execution_id
+        _CONTEXT_ADAPTER.validate_python(data)
 
 
 def test_execution_result_creation():
@@ -136,14 +181,15 @@ def test_pipeline_creation():
     assert pipeline.pipeline_type_name == "data-transformation"
 
 
-def test_pipeline_validation():
-    """Test Pipeline field validation."""
-    # Test required fields
-    with pytest.raises(ValidationError):
-        Pipeline(name="test")  # Missing pipeline_type_name
-
+@pytest.mark.parametrize(
+    "data",
+    [{"name": "test"}, {"pipeline_type_name": "data-transformation"}],
+    ids=["missing_pipeline_type_name", "missing_name"],
+)
+def test_pipeline_validation(data):
+    """Test Pipeline required fields."""
     with pytest.raises(ValidationError):
-        Pipeline(pipeline_type_name="data-transformation")  # Missing name
+        _PIPELINE_ADAPTER.validate_python(data)
 
 
 def test_pipeline_optional_fields():
@@ -161,20 +207,15 @@ def test_pipeline_optional_fields():
     assert pipeline.timeliness_number == 60
 
 
-def test_pipeline_config_creation():
+def test_pipeline_config_with_watermarks(basic_pipeline):
     """Test PipelineConfig creation with watermark fields."""
-    pipeline = Pipeline(
-        name="test-pipeline",
-        pipeline_type_name="data-transformation",
-    )
-
     address_lineage = AddressLineage(
         source_addresses=[],
         target_addresses=[],
     )
 
     config = PipelineConfig(
-        pipeline=pipeline,
+        pipeline=basic_pipeline,
         address_lineage=address_lineage,
         default_watermark="2024-01-01",
         next_watermark="2024-01-02",
@@ -185,69 +226,47 @@ def test_pipeline_config_creation():
     assert config.next_watermark == "2024-01-02"
 
 
-def test_address_lineage_creation():
+def test_address_lineage_creation(source_address, target_address):
     """Test AddressLineage creation."""
-    source = Address(
-        name="source-db",
-        address_type_name="database",
-        address_type_group_name="rdbms",
-    )
-    target = Address(
-        name="target-warehouse",
-        address_type_name="data-warehouse",
-        address_type_group_name="analytics",
+    lineage = AddressLineage(
+        source_addresses=[source_address],
+        target_addresses=[target_address],
     )
 
-    lineage = AddressLineage(source_addresses=[source], target_addresses=[target])
-
     assert len(lineage.source_addresses) == 1
     assert len(lineage.target_addresses) == 1
     assert lineage.source_addresses[0].name == "source-db"
     assert lineage.target_addresses[0].name == "target-warehouse"
 
 
-def test_address_lineage_validation():
-    """Test AddressLineage field validation."""
-    # Test required fields
-    with pytest.raises(ValidationError):
-        AddressLineage(source_addresses=[])  # Empty source_addresses
-
+@pytest.mark.parametrize(
+    "data",
+    [{"source_addresses": []}, {"target_addresses": []}],
+    ids=["missing_target_addresses", "missing_source_addresses"],
+)
+def test_address_lineage_validation(data):
+    """Test AddressLineage required fields."""
     with pytest.raises(ValidationError):
-        AddressLineage(target_addresses=[])  # Empty target_addresses
-
+        _LINEAGE_ADAPTER.validate_python(data)
 
-def test_address_validation():
-    """Test Address field validation."""
-    with pytest.raises(ValidationError):
-        Address(name="test")  # Missing required fields
 
+@pytest.mark.parametrize(
+    "data",
+    [{"name": "test"}, {"name": "test", "address_type_name": "database"}],
+    ids=["missing_type_fields", "missing_address_type_group_name"],
+)
+def test_address_validation(data):
+    """Test Address required fields."""
     with pytest.raises(ValidationError):
-        Address(
-            name="test", address_type_name="database"
-        )  # Missing address_type_group_name
+        _ADDRESS_ADAPTER.validate_python(data)
 
 
-def test_pipeline_config_creation():
+def test_pipeline_config_with_lineage(basic_pipeline, sample_lineage):
     """Test PipelineConfig creation."""
-    pipeline = Pipeline(name="test-pipeline", pipeline_type_name="data-transformation")
-
-    source = Address(
-        name="source-db",
-        address_type_name="database",
-        address_type_group_name="rdbms",
-    )
-    target = Address(
-        name="target-warehouse",
-        address_type_name="data-warehouse",
-        address_type_group_name="analytics",
-    )
+    config = PipelineConfig(pipeline=basic_pipeline, address_lineage=sample_lineage)
 
-    lineage = AddressLineage(source_addresses=[source], target_addresses=[target])
-
-    config = PipelineConfig(pipeline=pipeline, address_lineage=lineage)
-
-    assert config.pipeline == pipeline
-    assert config.address_lineage == lineage
+    assert config.pipeline is basic_pipeline
+    assert config.address_lineage is sample_lineage
 
 
 def test_pipeline_config_validation():
@@ -256,7 +275,7 @@ def test_pipeline_config_validation():
         PipelineConfig(pipeline=None, address_lineage=None)
 
 
-def test_synced_pipeline_config_creation():
+def test_synced_pipeline_config_creation(sample_lineage):
     """Test SyncedPipelineConfig creation."""
     pipeline = _PipelineWithResponse(
         name="test-pipeline",
@@ -265,35 +284,22 @@ def test_synced_pipeline_config_creation():
         active=True,
     )
 
-    source = Address(
-        name="source-db",
-        address_type_name="database",
-        address_type_group_name="rdbms",
-    )
-    target = Address(
-        name="target-warehouse",
-        address_type_name="data-warehouse",
-        address_type_group_name="analytics",
-    )
-
-    lineage = AddressLineage(source_addresses=[source], target_addresses=[target])
-
     config = SyncedPipelineConfig(
         pipeline=pipeline,
-        address_lineage=lineage,
+        address_lineage=sample_lineage,
         watermark="2024-01-01",
         default_watermark="2024-01-01",
         next_watermark="2024-01-02",
     )
 
-    assert config.pipeline == pipeline
-    assert config.address_lineage == lineage
+    assert config.pipeline is pipeline
+    assert config.address_lineage is sample_lineage
     assert config.watermark == "2024-01-01"
     assert config.pipeline.id == 123
     assert config.pipeline.active is True
 
 
-def test_synced_pipeline_config_inactive():
+def test_synced_pipeline_config_inactive(sample_lineage):
     """Test SyncedPipelineConfig with inactive pipeline."""
     pipeline = _PipelineWithResponse(
         name="test-pipeline",
@@ -302,22 +308,9 @@ def test_synced_pipeline_config_inactive():
         active=False,
     )
 
-    source = Address(
-        name="source-db",
-        address_type_name="database",
-        address_type_group_name="rdbms",
-    )
-    target = Address(
-        name="target-warehouse",
-        address_type_name="data-warehouse",
-        address_type_group_name="analytics",
-    )
-
-    lineage = AddressLineage(source_addresses=[source], target_addresses=[target])
-
     config = SyncedPipelineConfig(
         pipeline=pipeline,
-        address_lineage=lineage,
+        address_lineage=sample_lineage,
         watermark="2024-01-01",
         default_watermark="2024-01-01",
         next_watermark="2024-01-02",
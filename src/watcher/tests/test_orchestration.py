@@ -1,5 +1,5 @@
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -9,6 +9,33 @@ from watcher.orchestration import (
     OrchestratedETL,
     OrchestrationContext,
 )
+from watcher.tests.helpers import FakeAirflowContext, FakeDagsterContext
+
+pytestmark = [
+    # Every test gets its own monkeypatched Watcher, so the module is safe under xdist
+    pytest.mark.usefixtures("patched_watcher"),
+    # Deprecations fail fast; expected UserWarnings are asserted with pytest.warns
+    pytest.mark.filterwarnings("error::DeprecationWarning"),
+    pytest.mark.filterwarnings("ignore::UserWarning"),
+]
+
+_EXEC_DATE = datetime(2024, 1, 1)
+_WATERMARK = "2024-01-01"
+
+_RESULT_TEMPLATE = ETLResult.model_construct(
+    completed_successfully=True,
+    inserts=100,
+    total_rows=1000,
+    execution_metadata={"test": "metadata"},
+)
+
+# Airflow passes its context as a plain dict
+_AIRFLOW_CONTEXT = {
+    "run_id": "airflow_run_456",
+    "execution_date": _EXEC_DATE,
+    "dag_id": "test_dag",
+    "task_id": "test_task",
+}
 
 
 def test_orchestration_context_basic():
@@ -22,25 +49,37 @@ def test_orchestration_context_basic():
     assert context.partition_key == "2024-01-01"
 
 
-def test_orchestration_context_to_dict():
+@pytest.mark.parametrize(
+    "orchestrator,extra_fields",
+    [
+        ("airflow", {"custom_field": "custom_value"}),
+        ("dagster", {}),
+        ("custom", {"custom_field": "custom_value", "attempt": 2}),
+    ],
+    ids=["airflow", "no_extra_fields", "custom"],
+)
+def test_orchestration_context_to_dict(orchestrator, extra_fields):
     """Test context to dictionary conversion."""
     context = OrchestrationContext(
-        orchestrator="airflow",
+        orchestrator=orchestrator,
         run_id="test_run_456",
-        execution_date=datetime(2024, 1, 1),
+        execution_date=_EXEC_DATE,
         dag_id="test_dag",
         task_id="test_task",
-        custom_field="custom_value",
+        **extra_fields,
     )
 
     result = context.to_dict()
 
-    assert result["orchestrator"] == "airflow"
-    assert result["run_id"] == "test_run_456"
-    assert result["execution_date"] == "2024-01-01 00:00:00"
-    assert result["dag_id"] == "test_dag"
-    assert result["task_id"] == "test_task"
-    assert result["custom_field"] == "custom_value"
+    assert result == {
+        "orchestrator": orchestrator,
+        "run_id": "test_run_456",
+        "execution_date": "2024-01-01 00:00:00",
+        "partition_key": None,
+        "dag_id": "test_dag",
+        "task_id": "test_task",
+        **extra_fields,
+    }
 
 
 @pytest.fixture
@@ -51,114 +90,102 @@ def pipeline_config():
     )
 
 
+@pytest.fixture
+def patched_watcher(monkeypatch):
+    """Mock Watcher returned for every OrchestratedETL built in a test."""
+    mock_watcher = Mock()
+    monkeypatch.setattr(
+        "watcher.orchestration.Watcher", lambda *args, **kwargs: mock_watcher
+    )
+    return mock_watcher
+
+
 @pytest.fixture
 def etl_function():
     """Sample ETL function."""
 
     def etl_func(watcher_context: WatcherContext, **kwargs):
-        return ETLResult(
-            completed_successfully=True,
-            inserts=100,
-            total_rows=1000,
-            execution_metadata={"test": "metadata"},
+        # execute_etl merges orchestration metadata into the result in place
+        return _RESULT_TEMPLATE.model_copy(
+            update={"execution_metadata": dict(_RESULT_TEMPLATE.execution_metadata)}
         )
 
     return etl_func
 
 
-@patch("watcher.orchestration.Watcher")
-def test_orchestrated_etl_init(mock_watcher_class, pipeline_config):
+def test_orchestrated_etl_init(patched_watcher, pipeline_config):
     """Test OrchestratedETL initialization."""
-    mock_watcher = Mock()
-    mock_watcher_class.return_value = mock_watcher
-
     etl = OrchestratedETL("https://api.watcher.com", pipeline_config)
 
-    assert etl.watcher == mock_watcher
+    assert etl.watcher is patched_watcher
     assert etl.pipeline_config == pipeline_config
     assert etl._synced_config is None
 
 
-@patch("watcher.orchestration.Watcher")
-def test_detect_dagster_context(mock_watcher_class, pipeline_config):
+def test_detect_dagster_context(pipeline_config):
     """Test Dagster context detection."""
-    mock_watcher = Mock()
-    mock_watcher_class.return_value = mock_watcher
-
     etl = OrchestratedETL("https://api.watcher.com", pipeline_config)
 
-    # Mock Dagster context
-    dagster_context = Mock()
-    dagster_context.run_id = "dagster_run_123"
-    dagster_context.partition_key = "2024-01-01"
-    dagster_context.dag_id = "test_dag"
-    dagster_context.task_id = "test_task"
+    dagster_context = FakeDagsterContext(
+        run_id="dagster_run_123",
+        partition_key="2024-01-01",
+        dag_id="test_dag",
+        task_id="test_task",
+    )
 
     context = etl._detect_orchestration_context(dagster_context)
 
-    assert context.orchestrator == "dagster"
-    assert context.run_id == "dagster_run_123"
-    assert context.partition_key == "2024-01-01"
-    assert context.dag_id == "test_dag"
-    assert context.task_id == "test_task"
+    assert context.to_dict() == {
+        "orchestrator": "dagster",
+        "run_id": "dagster_run_123",
+        "execution_date": None,
+        "partition_key": "2024-01-01",
+        "dag_id": "test_dag",
+        "task_id": "test_task",
+    }
 
 
-@patch("watcher.orchestration.Watcher")
-def test_detect_airflow_dict_context(mock_watcher_class, pipeline_config):
+def test_detect_airflow_dict_context(pipeline_config):
     """Test Airflow dict context detection."""
-    mock_watcher = Mock()
-    mock_watcher_class.return_value = mock_watcher
-
     etl = OrchestratedETL("https://api.watcher.com", pipeline_config)
 
-    # Mock Airflow context (dict)
-    airflow_context = {
+    context = etl._detect_orchestration_context(_AIRFLOW_CONTEXT)
+
+    assert context.execution_date is _EXEC_DATE
+    assert context.to_dict() == {
+        "orchestrator": "airflow",
         "run_id": "airflow_run_456",
-        "execution_date": datetime(2024, 1, 1),
+        "execution_date": "2024-01-01 00:00:00",
+        "partition_key": None,
         "dag_id": "test_dag",
         "task_id": "test_task",
     }
 
-    context = etl._detect_orchestration_context(airflow_context)
-
-    assert context.orchestrator == "airflow"
-    assert context.run_id == "airflow_run_456"
-    assert context.execution_date == datetime(2024, 1, 1)
-    assert context.dag_id == "test_dag"
-    assert context.task_id == "test_task"
 
-
-@patch("watcher.orchestration.Watcher")
-def test_detect_airflow_object_context(mock_watcher_class, pipeline_config):
+def test_detect_airflow_object_context(pipeline_config):
     """Test Airflow object context detection."""
-    mock_watcher = Mock()
-    mock_watcher_class.return_value = mock_watcher
-
     etl = OrchestratedETL("https://api.watcher.com", pipeline_config)
 
-    # Mock Airflow context (object) - make sure it doesn't have run_id to avoid Dagster detection
-    airflow_context = Mock()
-    airflow_context.execution_date = datetime(2024, 1, 1)
-    airflow_context.dag_id = "test_dag"
-    airflow_context.task_id = "test_task"
-    # Explicitly delete run_id to avoid Dagster detection
-    del airflow_context.run_id
+    # Airflow context object has no run_id, so it is not detected as Dagster
+    airflow_context = FakeAirflowContext(
+        execution_date=_EXEC_DATE, dag_id="test_dag", task_id="test_task"
+    )
 
     context = etl._detect_orchestration_context(airflow_context)
 
-    assert context.orchestrator == "airflow"
-    assert context.run_id is None
-    assert context.execution_date == datetime(2024, 1, 1)
-    assert context.dag_id == "test_dag"
-    assert context.task_id == "test_task"
+    assert context.execution_date is _EXEC_DATE
+    assert context.to_dict() == {
+        "orchestrator": "airflow",
+        "run_id": None,
+        "execution_date": "2024-01-01 00:00:00",
+        "partition_key": None,
+        "dag_id": "test_dag",
+        "task_id": "test_task",
+    }
 
 
-@patch("watcher.orchestration.Watcher")
-def test_detect_unknown_context(mock_watcher_class, pipeline_config):
+def test_detect_unknown_context(pipeline_config):
     """Test unknown context detection."""
-    mock_watcher = Mock()
-    mock_watcher_class.return_value = mock_watcher
-
     etl = OrchestratedETL("https://api.watcher.com", pipeline_config)
 
     # Mock unknown context
@@ -171,188 +198,90 @@ def test_detect_unknown_context(mock_watcher_class, pipeline_config):
     assert context.run_id == str(id(unknown_context))
 
 
-@patch("watcher.orchestration.Watcher")
-def test_execute_etl_with_dagster_context(
-    mock_watcher_class, pipeline_config, etl_function
-):
-    """Test ETL execution with Dagster context."""
-    # Mock Watcher and synced config
-    mock_watcher = Mock()
-    mock_synced_config = Mock()
-    mock_synced_config.pipeline.id = 123
-    mock_synced_config.pipeline.active = True
-    mock_synced_config.watermark = "2024-01-01"
-    mock_synced_config.next_watermark = None
-    mock_watcher.sync_pipeline_config.return_value = mock_synced_config
-    mock_watcher_class.return_value = mock_watcher
-
-    # Mock the decorator
-    def mock_decorator(*args, **kwargs):
-        def decorator(func):
-            def wrapper(*args, **kwargs):
-                # Simulate the decorator behavior
-                watcher_context = WatcherContext(
-                    execution_id=456, pipeline_id=123, watermark="2024-01-01"
-                )
-                return func(watcher_context, **kwargs)
-
-            return wrapper
-
-        return decorator
+_WATCHER_CONTEXT = WatcherContext(
+    execution_id=456, pipeline_id=123, watermark=_WATERMARK
+)
 
-    mock_watcher.track_pipeline_execution = mock_decorator
 
-    etl = OrchestratedETL("https://api.watcher.com", pipeline_config)
+def mock_decorator(*args, **kwargs):
+    """Stand-in for Watcher.track_pipeline_execution."""
 
-    # Mock Dagster context
-    dagster_context = Mock()
-    dagster_context.run_id = "dagster_run_123"
-    dagster_context.partition_key = "2024-01-01"
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            # Simulate the decorator behavior
+            return func(_WATCHER_CONTEXT, **kwargs)
 
-    result = etl.execute_etl(etl_function, dagster_context)
+        return wrapper
 
-    assert isinstance(result, ETLResult)
-    assert result.completed_successfully is True
-    assert result.inserts == 100
-    assert result.total_rows == 1000
-    assert "orchestrator" in result.execution_metadata
-    assert result.execution_metadata["orchestrator"] == "dagster"
+    return decorator
 
 
-@patch("watcher.orchestration.Watcher")
-def test_execute_etl_with_airflow_context(
-    mock_watcher_class, pipeline_config, etl_function
-):
-    """Test ETL execution with Airflow context."""
-    # Mock Watcher and synced config
-    mock_watcher = Mock()
+@pytest.fixture
+def synced_watcher(patched_watcher):
+    """Mock Watcher that syncs to an active pipeline."""
     mock_synced_config = Mock()
     mock_synced_config.pipeline.id = 123
     mock_synced_config.pipeline.active = True
-    mock_synced_config.watermark = "2024-01-01"
+    mock_synced_config.watermark = _WATERMARK
     mock_synced_config.next_watermark = None
-    mock_watcher.sync_pipeline_config.return_value = mock_synced_config
-    mock_watcher_class.return_value = mock_watcher
+    patched_watcher.sync_pipeline_config.return_value = mock_synced_config
+    patched_watcher.track_pipeline_execution = mock_decorator
+    return patched_watcher
 
-    # Mock the decorator
-    def mock_decorator(*args, **kwargs):
-        def decorator(func):
-            def wrapper(*args, **kwargs):
-                # Simulate the decorator behavior
-                watcher_context = WatcherContext(
-                    execution_id=456, pipeline_id=123, watermark="2024-01-01"
-                )
-                return func(watcher_context, **kwargs)
 
-            return wrapper
+@pytest.fixture
+def mocked_orchestrated_etl(synced_watcher, pipeline_config):
+    """OrchestratedETL wired to a mock Watcher with an active synced pipeline."""
+    return OrchestratedETL("https://api.watcher.com", pipeline_config)
 
-        return decorator
 
-    mock_watcher.track_pipeline_execution = mock_decorator
+def _custom_context():
+    return OrchestrationContext(
+        orchestrator="custom", run_id="custom_run_789", custom_field="custom_value"
+    )
 
-    etl = OrchestratedETL("https://api.watcher.com", pipeline_config)
 
-    # Mock Airflow context
-    airflow_context = {
-        "run_id": "airflow_run_456",
-        "execution_date": datetime(2024, 1, 1),
-        "dag_id": "test_dag",
-        "task_id": "test_task",
-    }
-
-    result = etl.execute_etl(etl_function, airflow_context)
+@pytest.mark.parametrize(
+    "orchestration_context,expected_metadata",
+    [
+        (
+            FakeDagsterContext(run_id="dagster_run_123", partition_key="2024-01-01"),
+            {"orchestrator": "dagster"},
+        ),
+        (_AIRFLOW_CONTEXT, {"orchestrator": "airflow"}),
+        # A custom context is injected into execution_metadata as-is
+        (
+            _custom_context(),
+            {
+                "orchestrator": "custom",
+                "run_id": "custom_run_789",
+                "custom_field": "custom_value",
+            },
+        ),
+    ],
+    ids=["dagster", "airflow", "custom"],
+)
+def test_execute_etl_with_context(
+    mocked_orchestrated_etl, etl_function, orchestration_context, expected_metadata
+):
+    """Test ETL execution with Dagster, Airflow and custom contexts."""
+    result = mocked_orchestrated_etl.execute_etl(etl_function, orchestration_context)
 
     assert isinstance(result, ETLResult)
     assert result.completed_successfully is True
     assert result.inserts == 100
     assert result.total_rows == 1000
-    assert "orchestrator" in result.execution_metadata
-    assert result.execution_metadata["orchestrator"] == "airflow"
+    meta = result.execution_metadata
+    for key, value in expected_metadata.items():
+        assert meta[key] == value
 
 
-@patch("watcher.orchestration.Watcher")
-def test_execute_etl_invalid_return_type(mock_watcher_class, pipeline_config):
+def test_execute_etl_invalid_return_type(mocked_orchestrated_etl):
     """Test ETL execution with invalid return type."""
-    # Mock Watcher and synced config
-    mock_watcher = Mock()
-    mock_synced_config = Mock()
-    mock_synced_config.pipeline.id = 123
-    mock_synced_config.pipeline.active = True
-    mock_synced_config.watermark = "2024-01-01"
-    mock_synced_config.next_watermark = None
-    mock_watcher.sync_pipeline_config.return_value = mock_synced_config
-    mock_watcher_class.return_value = mock_watcher
-
-    # Mock the decorator
-    def mock_decorator(*args, **kwargs):
-        def decorator(func):
-            def wrapper(*args, **kwargs):
-                # Simulate the decorator behavior
-                watcher_context = WatcherContext(
-                    execution_id=456, pipeline_id=123, watermark="2024-01-01"
-                )
-                return func(watcher_context, **kwargs)
-
-            return wrapper
-
-        return decorator
-
-    mock_watcher.track_pipeline_execution = mock_decorator
-
-    etl = OrchestratedETL("https://api.watcher.com", pipeline_config)
 
     # ETL function that returns invalid type
     def invalid_etl_func(watcher_context: WatcherContext):
         return "not_an_etl_result"
 
     with pytest.raises(ValueError, match="ETL function must return ETLResult"):
-        etl.execute_etl(invalid_etl_func, None)
-
-
-@patch("watcher.orchestration.Watcher")
-def test_execute_etl_with_custom_context(
-    mock_watcher_class, pipeline_config, etl_function
-):
-    """Test ETL execution with custom orchestration context."""
-    # Mock Watcher and synced config
-    mock_watcher = Mock()
-    mock_synced_config = Mock()
-    mock_synced_config.pipeline.id = 123
-    mock_synced_config.pipeline.active = True
-    mock_synced_config.watermark = "2024-01-01"
-    mock_synced_config.next_watermark = None
-    mock_watcher.sync_pipeline_config.return_value = mock_synced_config
-    mock_watcher_class.return_value = mock_watcher
-
-    # Mock the decorator
-    def mock_decorator(*args, **kwargs):
-        def decorator(func):
-            def wrapper(*args, **kwargs):
-                # Simulate the decorator behavior
-                watcher_context = WatcherContext(
-                    execution_id=456, pipeline_id=123, watermark="2024-01-01"
-                )
-                return func(watcher_context, **kwargs)
-
-            return wrapper
-
-        return decorator
-
-    mock_watcher.track_pipeline_execution = mock_decorator
-
-    etl = OrchestratedETL("https://api.watcher.com", pipeline_config)
-
-    # Custom orchestration context
-    custom_context = OrchestrationContext(
-        orchestrator="custom", run_id="custom_run_789", custom_field="custom_value"
-    )
-
-    result = etl.execute_etl(etl_function, custom_context)
-
-    assert isinstance(result, ETLResult)
-    assert result.completed_successfully is True
-    # The custom context should be injected into execution_metadata
-    assert "orchestrator" in result.execution_metadata
-    assert result.execution_metadata["orchestrator"] == "custom"
-    assert result.execution_metadata["run_id"] == "custom_run_789"
-    assert result.execution_metadata["custom_field"] == "custom_value"
+        mocked_orchestrated_etl.execute_etl(invalid_etl_func, None)